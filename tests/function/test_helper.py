@@ -0,0 +1,97 @@
+# Copyright 2017-2019 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for the helper functions and classes of the zhmc CLI.
+"""
+
+from __future__ import absolute_import, print_function
+
+from zhmccli._helper import ResourceCache
+
+
+class TestResourceCache(object):
+    """
+    Tests for the ResourceCache class.
+    """
+
+    def test_cache_get(self):
+        # pylint: disable=no-self-use
+        """Test adding, getting and removing items"""
+
+        cache = ResourceCache()
+        cache['a'] = 1
+
+        assert len(cache) == 1
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('b', 2) == 2
+        assert cache.pop('a') == 1
+        assert cache.pop('a', 3) == 3
+        assert len(cache) == 0
+
+    def test_cache_eviction(self):
+        # pylint: disable=no-self-use
+        """Test that the least recently used item is evicted"""
+
+        cache = ResourceCache(maxsize=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        cache['c'] = 3
+
+        assert len(cache) == 2
+        assert 'a' not in cache
+        assert cache.get('b') == 2
+        assert cache.get('c') == 3
+
+    def test_cache_get_refreshes(self):
+        # pylint: disable=no-self-use
+        """Test that getting an item makes it the most recently used one"""
+
+        cache = ResourceCache(maxsize=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        assert cache.get('a') == 1
+        cache['c'] = 3
+
+        assert 'a' in cache
+        assert 'b' not in cache
+        assert 'c' in cache
+
+    def test_cache_set_refreshes(self):
+        # pylint: disable=no-self-use
+        """Test that setting an item makes it the most recently used one"""
+
+        cache = ResourceCache(maxsize=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        cache['a'] = 4
+        cache['c'] = 3
+
+        assert cache.get('a') == 4
+        assert 'b' not in cache
+        assert 'c' in cache
+
+    def test_cache_key_lock(self):
+        # pylint: disable=no-self-use
+        """Test that the lock for a key is the same for repeated calls"""
+
+        cache = ResourceCache()
+        lock_a = cache.key_lock('a')
+
+        assert cache.key_lock('a') is lock_a
+        assert cache.key_lock('b') is not lock_a
+        assert len(cache) == 0
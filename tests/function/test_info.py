@@ -20,6 +20,7 @@ that can be tested only with a subcommand.
 from __future__ import absolute_import, print_function
 
 import os
+import logging
 import subprocess
 import json
 import pytest
@@ -375,6 +376,34 @@ class TestInfo(object):
         assert_rc(exp_rc, rc, stdout, stderr)
         assert_patterns(exp_stderr_patterns, stderr.splitlines(), 'stderr')
 
+    def test_option_log_reset(self):
+        # pylint: disable=no-self-use
+        """
+        Test that the log level set with global option --log does not remain
+        in effect for a subsequent 'zhmc info' without that option.
+        """
+
+        faked_session = FakedSession(
+            'fake-host', 'hmc-name', '2.14.0', '10.2')
+        logger = logging.getLogger('zhmcclient.api')
+
+        # Invoke the command with the --log option
+        rc, stdout, stderr = call_zhmc_inline(
+            ['--log', 'api=debug', 'info'],
+            faked_session=faked_session)
+
+        assert_rc(0, rc, stdout, stderr)
+        assert logger.level == logging.DEBUG
+
+        # Invoke the command to be tested, without the --log option
+        rc, stdout, stderr = call_zhmc_inline(
+            ['info'],
+            faked_session=faked_session)
+
+        assert_rc(0, rc, stdout, stderr)
+        assert stderr == ""
+        assert logger.level == logging.NOTSET
+
     @pytest.mark.parametrize(
         "logdest_value, exp_rc, exp_stderr_patterns", [
             (None, 0, LOG_API_DEBUG_PATTERNS),
@@ -0,0 +1,680 @@
+# Copyright 2017-2019 IBM Corp. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Function tests for the 'zhmc partition' command group.
+"""
+
+from __future__ import absolute_import, print_function
+
+import json
+import threading
+from datetime import datetime
+import pytest
+import click
+
+import zhmcclient
+from zhmcclient_mock import FakedSession, FakedMetricGroupDefinition, \
+    FakedMetricObjectValues
+
+from zhmccli._helper import CmdContext
+from zhmccli._cmd_partition import process_partitions, \
+    list_with_properties, find_partition, cmd_partition_update, \
+    partition_update
+
+from .utils import call_zhmc_inline, assert_rc
+
+
+def faked_session_with_partitions(partitions, hmc_version='2.14.0',
+                                  api_version='2.20'):
+    """
+    Return a faked session with a CPC in DPM mode that has the specified
+    partitions.
+
+    Parameters:
+
+      partitions (list of tuple(name, status)): The partitions.
+
+      hmc_version (string): The HMC version of the faked HMC.
+
+      api_version (string): The API version of the faked HMC.
+    """
+    faked_session = FakedSession(
+        'fake-host', 'fake-hmc', hmc_version, api_version)
+    faked_session.hmc.add_resources({
+        'cpcs': [{
+            'properties': {
+                'object-id': 'cpc1',
+                'name': 'CPC1',
+                'dpm-enabled': True,
+            },
+            'partitions': [
+                {
+                    'properties': {
+                        'object-id': name.lower(),
+                        'name': name,
+                        'status': status,
+                        'type': 'linux',
+                        'description': 'desc',
+                    },
+                }
+                for name, status in partitions
+            ],
+        }],
+    })
+    return faked_session
+
+
+def partition_props(faked_session, name):
+    """
+    Return the properties of a partition in the faked session.
+    """
+    faked_cpc = faked_session.hmc.cpcs.lookup_by_oid('cpc1')
+    for faked_partition in faked_cpc.partitions.list():
+        if faked_partition.properties['name'] == name:
+            return faked_partition.properties
+    raise ValueError("Partition not found: {}".format(name))
+
+
+def faked_session_for_usage(hmc_version, api_version):
+    """
+    Return a faked session with two CPCs in DPM mode that have partitions
+    with the properties for the usage related options of 'partition list',
+    and with processor-usage metric values for the active partitions.
+
+    In CPC1, the total CP weight of the active shared partitions is 0.
+    CPC2 has a partition with the same name as a partition in CPC1.
+    """
+    faked_session = FakedSession(
+        'fake-host', 'fake-hmc', hmc_version, api_version)
+
+    def part(oid, name, status, mode, ifls, cps, ifl_weight, cp_weight):
+        # pylint: disable=too-many-arguments
+        return {
+            'properties': {
+                'object-id': oid,
+                'name': name,
+                'status': status,
+                'type': 'linux',
+                'processor-mode': mode,
+                'ifl-processors': ifls,
+                'cp-processors': cps,
+                'initial-ifl-processing-weight': ifl_weight,
+                'initial-cp-processing-weight': cp_weight,
+            },
+        }
+
+    faked_session.hmc.add_resources({
+        'cpcs': [
+            {
+                'properties': {
+                    'object-id': 'cpc1',
+                    'name': 'CPC1',
+                    'dpm-enabled': True,
+                    'processor-count-ifl': 10,
+                    'processor-count-general-purpose': 4,
+                },
+                'partitions': [
+                    part('pa', 'PA', 'active', 'shared', 4, 0, 30, 0),
+                    part('pb', 'PB', 'active', 'shared', 2, 0, 10, 0),
+                    part('pc', 'PC', 'active', 'dedicated', 2, 1, 1, 1),
+                    part('pd', 'PD', 'stopped', 'shared', 2, 1, 60, 60),
+                ],
+            },
+            {
+                'properties': {
+                    'object-id': 'cpc2',
+                    'name': 'CPC2',
+                    'dpm-enabled': True,
+                    'processor-count-ifl': 8,
+                    'processor-count-general-purpose': 2,
+                },
+                'partitions': [
+                    part('px', 'PA', 'active', 'shared', 2, 1, 20, 20),
+                ],
+            },
+        ],
+    })
+
+    mc_manager = faked_session.hmc.metrics_contexts
+    mc_manager.add_metric_group_definition(
+        FakedMetricGroupDefinition(
+            name='partition-usage',
+            types=[('processor-usage', 'integer-metric')]))
+    usages = [('cpc1', 'pa', 50), ('cpc1', 'pb', 20), ('cpc1', 'pc', 10),
+              ('cpc2', 'px', 99)]
+    for cpc_oid, partition_oid, usage in usages:
+        faked_partition = faked_session.hmc.cpcs.lookup_by_oid(cpc_oid). \
+            partitions.lookup_by_oid(partition_oid)
+        mc_manager.add_metric_values(
+            FakedMetricObjectValues(
+                group_name='partition-usage',
+                resource_uri=faked_partition.uri,
+                timestamp=datetime.now(),
+                values=[('processor-usage', usage)]))
+    return faked_session
+
+
+class TestPartitionList(object):
+    """
+    Tests for the 'zhmc partition list' command.
+    """
+
+    # The faked HMC does not support filtering the permitted partitions by
+    # CPC name, so listing the partitions of one CPC is tested only with an
+    # HMC that does not support listing the permitted partitions.
+    @pytest.mark.parametrize(
+        "hmc_version, api_version, cpc_args, exp_rows", [
+            ('2.13.1', '1.8', ['CPC1'],
+             # name, cpc, mode, ifl-capacity, cp-capacity, usage, used
+             [('PA', 'CPC1', 'shared', 7.5, 0.0, 50, 3.75),
+              ('PB', 'CPC1', 'shared', 2.5, 0.0, 20, 0.5),
+              ('PC', 'CPC1', 'dedicated', 2.0, 1.0, 10, 0.3),
+              ('PD', 'CPC1', 'shared', None, None, None, None)]),
+            ('2.13.1', '1.8', [],
+             [('PA', 'CPC1', 'shared', 7.5, 0.0, 50, 3.75),
+              ('PA', 'CPC2', 'shared', 8.0, 2.0, 99, 9.9),
+              ('PB', 'CPC1', 'shared', 2.5, 0.0, 20, 0.5),
+              ('PC', 'CPC1', 'dedicated', 2.0, 1.0, 10, 0.3),
+              ('PD', 'CPC1', 'shared', None, None, None, None)]),
+            ('2.14.0', '2.20', [],
+             [('PA', 'CPC1', 'shared', 7.5, 0.0, 50, 3.75),
+              ('PA', 'CPC2', 'shared', 8.0, 2.0, 99, 9.9),
+              ('PB', 'CPC1', 'shared', 2.5, 0.0, 20, 0.5),
+              ('PC', 'CPC1', 'dedicated', 2.0, 1.0, 10, 0.3),
+              ('PD', 'CPC1', 'shared', None, None, None, None)]),
+        ]
+    )
+    def test_partition_list_usage(
+            self, hmc_version, api_version, cpc_args, exp_rows):
+        # pylint: disable=no-self-use
+        """
+        Test 'zhmc partition list' with the --ifl-usage and --cp-usage
+        options, for shared, dedicated and stopped partitions in multiple
+        CPCs, including a CPC where the total CP weight is 0.
+        """
+
+        faked_session = faked_session_for_usage(hmc_version, api_version)
+
+        # Invoke the command to be tested
+        args = ['-o', 'json', 'partition', 'list'] + cpc_args
+        args.extend(['--ifl-usage', '--cp-usage'])
+        rc, stdout, stderr = call_zhmc_inline(
+            args, faked_session=faked_session)
+
+        assert_rc(0, rc, stdout, stderr)
+        assert stderr == ""
+        rows = sorted(
+            tuple(round(v, 6) if isinstance(v, float) else v for v in (
+                r['name'], r['cpc'], r['processor-mode'], r['ifl-capacity'],
+                r['cp-capacity'], r['processor-usage'], r['processors-used']))
+            for r in json.loads(stdout))
+        # The capacity of shared partitions is the number of IFLs or CPs of
+        # the CPC times the weight of the partition, divided by the total
+        # weight of all active shared partitions. In CPC1, there are 10 IFLs
+        # with a total weight of 40, and 4 CPs with a total weight of 0.
+        # Only the listed partitions get the processor-usage metric values.
+        assert rows == exp_rows
+
+
+class TestPartitionStartStop(object):
+    """
+    Tests for the 'zhmc partition start' and 'zhmc partition stop' commands.
+    """
+
+    @pytest.mark.parametrize(
+        "command, status, exp_status, exp_verb", [
+            ('start', 'stopped', 'active', 'started'),
+            ('stop', 'active', 'stopped', 'stopped'),
+        ]
+    )
+    def test_partition_startstop_multiple(
+            self, command, status, exp_status, exp_verb):
+        # pylint: disable=no-self-use
+        """
+        Test 'zhmc partition start/stop' with multiple partitions, including
+        a duplicate partition.
+        """
+
+        faked_session = faked_session_with_partitions(
+            [('P1', status), ('P2', status), ('P3', status)])
+
+        # Invoke the command to be tested
+        rc, stdout, stderr = call_zhmc_inline(
+            ['partition', command, 'CPC1', 'P3', 'P1', 'P3'],
+            faked_session=faked_session)
+
+        assert_rc(0, rc, stdout, stderr)
+        assert stdout == \
+            "Partition P3 has been {v}.\n" \
+            "Partition P1 has been {v}.\n".format(v=exp_verb)
+        assert stderr == ""
+        assert partition_props(faked_session, 'P1')['status'] == exp_status
+        assert partition_props(faked_session, 'P2')['status'] == status
+        assert partition_props(faked_session, 'P3')['status'] == exp_status
+
+    def test_partition_start_multiple_error(self):
+        # pylint: disable=no-self-use
+        """
+        Test 'zhmc partition start' with multiple partitions, where one of
+        them does not exist.
+        """
+
+        faked_session = faked_session_with_partitions(
+            [('P1', 'stopped'), ('P2', 'stopped')])
+
+        # Invoke the command to be tested
+        rc, stdout, stderr = call_zhmc_inline(
+            ['partition', 'start', 'CPC1', 'P1', 'PX', 'P2'],
+            faked_session=faked_session)
+
+        assert_rc(1, rc, stdout, stderr)
+        assert stdout == \
+            "Partition P1 has been started.\n" \
+            "Partition P2 has been started.\n"
+        assert stderr == "Error: Partition PX: Partition not found: PX\n"
+        assert partition_props(faked_session, 'P1')['status'] == 'active'
+        assert partition_props(faked_session, 'P2')['status'] == 'active'
+
+    def test_partition_start_no_partition(self):
+        # pylint: disable=no-self-use
+        """
+        Test 'zhmc partition start' without a partition.
+        """
+
+        faked_session = faked_session_with_partitions([('P1', 'stopped')])
+
+        # Invoke the command to be tested
+        rc, stdout, stderr = call_zhmc_inline(
+            ['partition', 'start', 'CPC1'],
+            faked_session=faked_session)
+
+        assert_rc(2, rc, stdout, stderr)
+        assert stdout == ""
+        assert "Missing argument" in stderr
+        assert partition_props(faked_session, 'P1')['status'] == 'stopped'
+
+
+class TestPartitionUpdate(object):
+    """
+    Tests for the 'zhmc partition update' command.
+    """
+
+    def test_partition_update_multiple(self):
+        # pylint: disable=no-self-use
+        """
+        Test 'zhmc partition update' with multiple partitions, including
+        a partition that already has the specified properties.
+        """
+
+        faked_session = faked_session_with_partitions(
+            [('P1', 'stopped'), ('P2', 'stopped'), ('P3', 'stopped')])
+        partition_props(faked_session, 'P2')['description'] = 'new'
+
+        # Invoke the command to be tested
+        rc, stdout, stderr = call_zhmc_inline(
+            ['partition', 'update', 'CPC1', 'P3', 'P2', 'P1', 'P3',
+             '--description', 'new'],
+            faked_session=faked_session)
+
+        assert_rc(0, rc, stdout, stderr)
+        assert stdout == \
+            "Partition P3 has been updated.\n" \
+            "Partition P2 already has the specified properties.\n" \
+            "Partition P1 has been updated.\n"
+        assert stderr == ""
+        for name in ('P1', 'P2', 'P3'):
+            assert partition_props(faked_session, name)['description'] == \
+                'new'
+
+    def test_partition_update_unchanged(self):
+        # pylint: disable=no-self-use
+        """
+        Test 'zhmc partition update' with properties that the partition
+        already has, which does not update the partition.
+        """
+
+        faked_session = faked_session_with_partitions([('P1', 'stopped')])
+        faked_cpc = faked_session.hmc.cpcs.lookup_by_oid('cpc1')
+        faked_partition = faked_cpc.partitions.lookup_by_oid('p1')
+
+        def update_not_allowed(properties):
+            raise AssertionError(
+                "Unexpected update of partition properties: {}".
+                format(properties))
+
+        faked_partition.update = update_not_allowed
+
+        # Invoke the command to be tested
+        rc, stdout, stderr = call_zhmc_inline(
+            ['partition', 'update', 'CPC1', 'P1', '--description', 'desc'],
+            faked_session=faked_session)
+
+        assert_rc(0, rc, stdout, stderr)
+        assert stdout == "Partition P1 already has the specified properties.\n"
+        assert stderr == ""
+
+    def test_partition_update_boot_error(self):
+        # pylint: disable=no-self-use
+        """
+        Test 'zhmc partition update' with multiple partitions and incomplete
+        boot options, which is rejected once for all partitions.
+        """
+
+        faked_session = faked_session_with_partitions(
+            [('P1', 'stopped'), ('P2', 'stopped')])
+
+        # Invoke the command to be tested
+        rc, stdout, stderr = call_zhmc_inline(
+            ['partition', 'update', 'CPC1', 'P1', 'P2',
+             '--boot-storage-hba', 'hba1'],
+            faked_session=faked_session)
+
+        assert_rc(1, rc, stdout, stderr)
+        assert stdout == ""
+        assert stderr == \
+            "Error: Boot from storage volume specified using the deprecated " \
+            "options --boot-storage-hba/lun/wwpn, but misses the following " \
+            "options: --boot-storage-lun, --boot-storage-wwpn\n"
+
+    def test_partition_update_multiple_hba(self):
+        # pylint: disable=no-self-use
+        """
+        Test 'zhmc partition update' with multiple partitions and the
+        deprecated boot storage options, where the HBA exists only in one of
+        the partitions.
+        """
+
+        faked_session = faked_session_with_partitions(
+            [('P1', 'stopped'), ('P2', 'stopped')])
+        faked_cpc = faked_session.hmc.cpcs.lookup_by_oid('cpc1')
+        faked_hba = faked_cpc.partitions.lookup_by_oid('p1').hbas.add({
+            'element-id': 'hba1',
+            'name': 'HBA1',
+        })
+
+        # Invoke the command to be tested
+        rc, stdout, stderr = call_zhmc_inline(
+            ['partition', 'update', 'CPC1', 'P1', 'P2',
+             '--boot-storage-hba', 'HBA1', '--boot-storage-lun', '0',
+             '--boot-storage-wwpn', '1234'],
+            faked_session=faked_session)
+
+        assert_rc(1, rc, stdout, stderr)
+        assert stdout == \
+            "Deprecated: The options --boot-storage-hba/lun/wwpn are " \
+            "deprecated. Use the --boot-storage-volume option instead\n" \
+            "Partition P1 has been updated.\n"
+        assert stderr == \
+            "Error: Partition P2: Could not find HBA HBA1 in partition P2 " \
+            "in CPC CPC1.\n"
+        p1_props = partition_props(faked_session, 'P1')
+        assert p1_props['boot-device'] == 'storage-adapter'
+        assert p1_props['boot-storage-device'] == faked_hba.uri
+        assert 'boot-device' not in partition_props(faked_session, 'P2')
+
+    def test_partition_update_multiple_name(self):
+        # pylint: disable=no-self-use
+        """
+        Test 'zhmc partition update' with the --name option and multiple
+        partitions, which is rejected.
+        """
+
+        faked_session = faked_session_with_partitions(
+            [('P1', 'stopped'), ('P2', 'stopped')])
+
+        # Invoke the command to be tested
+        rc, stdout, stderr = call_zhmc_inline(
+            ['partition', 'update', 'CPC1', 'P1', 'P2', '--name', 'P3'],
+            faked_session=faked_session)
+
+        assert_rc(1, rc, stdout, stderr)
+        assert stdout == ""
+        assert stderr == \
+            "Error: The --name option cannot be used when updating multiple " \
+            "partitions\n"
+        assert partition_props(faked_session, 'P1')['name'] == 'P1'
+        assert partition_props(faked_session, 'P2')['name'] == 'P2'
+
+    def test_partition_update_single_name(self):
+        # pylint: disable=no-self-use
+        """
+        Test 'zhmc partition update' with the --name option and a partition
+        that is specified twice, which renames the partition.
+        """
+
+        faked_session = faked_session_with_partitions([('P1', 'stopped')])
+
+        # Invoke the command to be tested
+        rc, stdout, stderr = call_zhmc_inline(
+            ['partition', 'update', 'CPC1', 'P1', 'P1', '--name', 'P2'],
+            faked_session=faked_session)
+
+        assert_rc(0, rc, stdout, stderr)
+        assert stdout == \
+            "Partition P1 has been renamed to P2 and was updated.\n"
+        assert stderr == ""
+        assert partition_props(faked_session, 'P2')['description'] == 'desc'
+
+
+def faked_cmd_context(faked_session):
+    """
+    Return a command context for the faked session.
+    """
+    return CmdContext(
+        None, None, None, False, None, 'table', False, 'msg', False,
+        faked_session, None)
+
+
+def count_calls(monkeypatch, cls, method_name, calls):
+    """
+    Replace a method of a class with a function that counts its calls in
+    the 'calls' dict, using 'class.method' as a key, and invokes the
+    original method.
+    """
+    org_method = getattr(cls, method_name)
+    key = '{c}.{m}'.format(c=cls.__name__, m=method_name)
+    calls[key] = 0
+
+    def counting_method(self, *args, **kwargs):
+        calls[key] += 1
+        return org_method(self, *args, **kwargs)
+
+    monkeypatch.setattr(cls, method_name, counting_method)
+
+
+class TestFindPartition(object):
+    """
+    Tests for the find_partition() function and its resource cache.
+    """
+
+    @pytest.mark.parametrize(
+        "hmc_version, api_version, exp_calls", [
+            ('2.14.0', '2.20',
+             {'Console.list_permitted_partitions': 1,
+              'CpcManager.list': 0, 'PartitionManager.list': 0}),
+            ('2.13.1', '1.8',
+             {'Console.list_permitted_partitions': 0,
+              'CpcManager.list': 1, 'PartitionManager.list': 1}),
+        ]
+    )
+    def test_find_partition_cached(
+            self, monkeypatch, hmc_version, api_version, exp_calls):
+        # pylint: disable=no-self-use
+        """
+        Test that repeated lookups of a partition cause only one lookup of
+        the partition (and its CPC) on the HMC.
+        """
+
+        faked_session = faked_session_with_partitions(
+            [('P1', 'stopped'), ('P2', 'stopped')],
+            hmc_version=hmc_version, api_version=api_version)
+        calls = {}
+        count_calls(monkeypatch, zhmcclient.Console,
+                    'list_permitted_partitions', calls)
+        count_calls(monkeypatch, zhmcclient.CpcManager, 'list', calls)
+        count_calls(monkeypatch, zhmcclient.PartitionManager, 'list', calls)
+        cmd_ctx = faked_cmd_context(faked_session)
+        partitions = []
+
+        def find_partitions():
+            client = cmd_ctx.client
+            for _ in range(3):
+                partitions.append(
+                    find_partition(cmd_ctx, client, 'CPC1', 'P1'))
+
+        cmd_ctx.execute_cmd(find_partitions)
+
+        assert calls == exp_calls
+        assert partitions[0].name == 'P1'
+        assert partitions[1] is partitions[0]
+        assert partitions[2] is partitions[0]
+
+    def test_find_partition_renamed(self):
+        # pylint: disable=no-self-use
+        """
+        Test that a partition that has been renamed by 'partition update' is
+        no longer found under its old name.
+        """
+
+        faked_session = faked_session_with_partitions([('P1', 'stopped')])
+        cmd_ctx = faked_cmd_context(faked_session)
+        options = {param.name: None for param in partition_update.params
+                   if param.name not in ('cpc', 'partitions')}
+        options['name'] = 'P2'
+        partitions = []
+
+        def rename_partition():
+            client = cmd_ctx.client
+            partitions.append(find_partition(cmd_ctx, client, 'CPC1', 'P1'))
+            cmd_partition_update(cmd_ctx, 'CPC1', ['P1'], options)
+            partitions.append(find_partition(cmd_ctx, client, 'CPC1', 'P2'))
+            find_partition(cmd_ctx, client, 'CPC1', 'P1')
+
+        with pytest.raises(click.ClickException) as exc_info:
+            cmd_ctx.execute_cmd(rename_partition)
+
+        assert exc_info.value.message == "Partition not found: P1"
+        assert partitions[1].uri == partitions[0].uri
+
+
+class TestProcessPartitions(object):
+    """
+    Tests for the process_partitions() function.
+    """
+
+    def test_process_partitions_logon(self, monkeypatch):
+        # pylint: disable=no-self-use
+        """
+        Test that process_partitions() with multiple partitions and a real
+        session that is not yet logged on prompts for the password and logs
+        on to the HMC only once, before the partitions are processed.
+        """
+
+        counts = {'pw': 0, 'logon': 0}
+        logged_on = []  # Whether logged on, when processing each partition
+        lock = threading.Lock()
+
+        def get_password(host, userid):
+            # pylint: disable=unused-argument
+            with lock:
+                counts['pw'] += 1
+            return 'password'
+
+        def is_logon(self, verify=False):
+            # pylint: disable=unused-argument
+            return counts['logon'] > 0
+
+        def logon(self, verify=False):
+            if not self.is_logon(verify):
+                get_password(self.host, self.userid)
+                with lock:
+                    counts['logon'] += 1
+
+        monkeypatch.setattr(zhmcclient.Session, 'is_logon', is_logon)
+        monkeypatch.setattr(zhmcclient.Session, 'logon', logon)
+
+        cmd_ctx = CmdContext(
+            'fake-host', 'fake-user', None, False, None, 'table', False,
+            'msg', False, None, get_password)
+
+        def logon_required_op(name):
+            # Simulate the logon that precedes each HMC operation
+            with lock:
+                logged_on.append(cmd_ctx.session.is_logon())
+            cmd_ctx.session.logon()
+            return "Partition {} has been processed.".format(name)
+
+        cmd_ctx.execute_cmd(
+            lambda: process_partitions(
+                cmd_ctx, ['P1', 'P2', 'P3', 'P4'], logon_required_op))
+
+        assert counts == {'pw': 1, 'logon': 1}
+        assert logged_on == [True] * 4
+
+
+class TestListWithProperties(object):
+    """
+    Tests for the list_with_properties() function.
+    """
+
+    def test_list_props_unsupported(self):
+        # pylint: disable=no-self-use
+        """
+        Test list_with_properties() with a list method that does not support
+        additional properties.
+        """
+        calls = []
+
+        def list_method(full_properties=False, filter_args=None):
+            calls.append((full_properties, filter_args))
+            return ['p1']
+
+        result = list_with_properties(list_method, {'name': 'P1'}, ['type'])
+
+        assert result == ['p1']
+        assert calls == [(False, {'name': 'P1'})]
+
+    def test_list_props_supported(self):
+        # pylint: disable=no-self-use
+        """
+        Test list_with_properties() with a list method that supports
+        additional properties.
+        """
+        calls = []
+
+        def list_method(full_properties=False, filter_args=None,
+                        additional_properties=None):
+            calls.append((full_properties, filter_args, additional_properties))
+            return ['p1']
+
+        result = list_with_properties(list_method, None, ['type'])
+
+        assert result == ['p1']
+        assert calls == [(False, None, ['type'])]
+
+    def test_list_props_typeerror(self):
+        # pylint: disable=no-self-use
+        """
+        Test that list_with_properties() does not hide a TypeError raised by
+        a list method that supports additional properties.
+        """
+
+        def list_method(full_properties=False, filter_args=None,
+                        additional_properties=None):
+            # pylint: disable=unused-argument
+            raise TypeError("Error in list method")
+
+        with pytest.raises(TypeError):
+            list_with_properties(list_method, None, ['type'])
@@ -188,7 +188,7 @@ def adapter_delete_hipersocket(cmd_ctx, cpc, adapter):
 def cmd_adapter_list(cmd_ctx, cpc_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     cpc = find_cpc(cmd_ctx, client, cpc_name)
 
     try:
@@ -233,7 +233,7 @@ def cmd_adapter_list(cmd_ctx, cpc_name, options):
 def cmd_adapter_show(cmd_ctx, cpc_name, adapter_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     adapter = find_adapter(cmd_ctx, client, cpc_name, adapter_name)
 
     try:
@@ -247,7 +247,7 @@ def cmd_adapter_show(cmd_ctx, cpc_name, adapter_name):
 def cmd_adapter_update(cmd_ctx, cpc_name, adapter_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     adapter = find_adapter(cmd_ctx, client, cpc_name, adapter_name)
 
     name_map = {
@@ -280,7 +280,7 @@ def cmd_adapter_update(cmd_ctx, cpc_name, adapter_name, options):
 def cmd_adapter_create_hipersocket(cmd_ctx, cpc_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     cpc = find_cpc(cmd_ctx, client, cpc_name)
 
     name_map = {
@@ -302,7 +302,7 @@ def cmd_adapter_create_hipersocket(cmd_ctx, cpc_name, options):
 def cmd_adapter_delete_hipersocket(cmd_ctx, cpc_name, adapter_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     adapter = find_adapter(cmd_ctx, client, cpc_name, adapter_name)
 
     try:
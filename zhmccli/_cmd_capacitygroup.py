@@ -238,7 +238,7 @@ def capacitygroup_remove_partition(cmd_ctx, cpc, capacitygroup, **options):
 def cmd_capacitygroup_list(cmd_ctx, cpc_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     cpc = find_cpc(cmd_ctx, client, cpc_name)
 
     try:
@@ -287,7 +287,7 @@ def cmd_capacitygroup_list(cmd_ctx, cpc_name, options):
 def cmd_capacitygroup_show(cmd_ctx, cpc_name, capacitygroup_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     capacitygroup = find_capacitygroup(
         cmd_ctx, client, cpc_name, capacitygroup_name)
 
@@ -302,7 +302,7 @@ def cmd_capacitygroup_show(cmd_ctx, cpc_name, capacitygroup_name):
 def cmd_capacitygroup_update(cmd_ctx, cpc_name, capacitygroup_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     capacitygroup = find_capacitygroup(
         cmd_ctx, client, cpc_name, capacitygroup_name)
 
@@ -338,7 +338,7 @@ def cmd_capacitygroup_update(cmd_ctx, cpc_name, capacitygroup_name, options):
 def cmd_capacitygroup_create(cmd_ctx, cpc_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     cpc = find_cpc(cmd_ctx, client, cpc_name)
 
     name_map = {
@@ -362,7 +362,7 @@ def cmd_capacitygroup_create(cmd_ctx, cpc_name, options):
 def cmd_capacitygroup_delete(cmd_ctx, cpc_name, capacitygroup_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     capacitygroup = find_capacitygroup(
         cmd_ctx, client, cpc_name, capacitygroup_name)
 
@@ -380,7 +380,7 @@ def cmd_capacitygroup_add_partition(
         cmd_ctx, cpc_name, capacitygroup_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     capacitygroup = find_capacitygroup(
         cmd_ctx, client, cpc_name, capacitygroup_name)
     cpc = find_cpc(cmd_ctx, client, cpc_name)
@@ -410,7 +410,7 @@ def cmd_capacitygroup_remove_partition(
         cmd_ctx, cpc_name, capacitygroup_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     capacitygroup = find_capacitygroup(
         cmd_ctx, client, cpc_name, capacitygroup_name)
     cpc = find_cpc(cmd_ctx, client, cpc_name)
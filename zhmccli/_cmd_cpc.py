@@ -36,11 +36,26 @@ DEFAULT_POWER_CAPPING_STATE = 'disabled'
 def find_cpc(cmd_ctx, client, cpc_name):
     """
     Find a CPC by name and return its resource object.
+
+    The CPC is cached in the command context, so that repeated lookups of the
+    same CPC do not cause repeated HMC operations. This includes concurrent
+    lookups of the same CPC from multiple threads, e.g. when multiple
+    partitions of a CPC are processed concurrently.
     """
-    try:
-        cpc = client.cpcs.find(name=cpc_name)
-    except zhmcclient.Error as exc:
-        raise click_exception(exc, cmd_ctx.error_format)
+    cache_key = ('cpc', cpc_name)
+    resource_cache = cmd_ctx.resource_cache
+    cpc = resource_cache.get(cache_key, None)
+    if cpc is not None:
+        return cpc
+    with resource_cache.key_lock(cache_key):
+        # Another thread may have looked up the CPC in the meantime
+        cpc = resource_cache.get(cache_key, None)
+        if cpc is None:
+            try:
+                cpc = client.cpcs.find(name=cpc_name)
+            except zhmcclient.Error as exc:
+                raise click_exception(exc, cmd_ctx.error_format)
+            resource_cache[cache_key] = cpc
     return cpc
 
 
@@ -197,7 +212,7 @@ def get_em_data(cmd_ctx, cpc):
 def cmd_cpc_list(cmd_ctx, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
 
     try:
         cpcs = client.cpcs.list()
@@ -235,7 +250,7 @@ def cmd_cpc_list(cmd_ctx, options):
 def cmd_cpc_show(cmd_ctx, cpc_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     cpc = find_cpc(cmd_ctx, client, cpc_name)
 
     try:
@@ -261,7 +276,7 @@ def cmd_cpc_show(cmd_ctx, cpc_name, options):
 def cmd_cpc_update(cmd_ctx, cpc_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     cpc = find_cpc(cmd_ctx, client, cpc_name)
 
     name_map = {
@@ -310,7 +325,7 @@ def cmd_cpc_update(cmd_ctx, cpc_name, options):
 def cmd_cpc_set_power_save(cmd_ctx, cpc_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     cpc = find_cpc(cmd_ctx, client, cpc_name)
 
     org_options = original_options(options)
@@ -324,7 +339,7 @@ def cmd_cpc_set_power_save(cmd_ctx, cpc_name, options):
 def cmd_cpc_set_power_capping(cmd_ctx, cpc_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     cpc = find_cpc(cmd_ctx, client, cpc_name)
 
     org_options = original_options(options)
@@ -341,7 +356,7 @@ def cmd_cpc_set_power_capping(cmd_ctx, cpc_name, options):
 def cmd_cpc_get_em_data(cmd_ctx, cpc_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     cpc = find_cpc(cmd_ctx, client, cpc_name)
 
     energy_props = cpc.get_energy_management_properties()
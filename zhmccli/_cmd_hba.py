@@ -163,7 +163,7 @@ def hba_delete(cmd_ctx, cpc, partition, hba):
 def cmd_hba_list(cmd_ctx, cpc_name, partition_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
     if partition.hbas is None:
@@ -205,7 +205,7 @@ def cmd_hba_list(cmd_ctx, cpc_name, partition_name, options):
 def cmd_hba_show(cmd_ctx, cpc_name, partition_name, hba_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     hba = find_hba(cmd_ctx, client, cpc_name, partition_name, hba_name)
 
     try:
@@ -219,7 +219,7 @@ def cmd_hba_show(cmd_ctx, cpc_name, partition_name, hba_name):
 def cmd_hba_create(cmd_ctx, cpc_name, partition_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
     name_map = {
@@ -262,7 +262,7 @@ def cmd_hba_create(cmd_ctx, cpc_name, partition_name, options):
 def cmd_hba_update(cmd_ctx, cpc_name, partition_name, hba_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     hba = find_hba(cmd_ctx, client, cpc_name, partition_name, hba_name)
 
     org_options = original_options(options)
@@ -290,7 +290,7 @@ def cmd_hba_update(cmd_ctx, cpc_name, partition_name, hba_name, options):
 def cmd_hba_delete(cmd_ctx, cpc_name, partition_name, hba_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     hba = find_hba(cmd_ctx, client, cpc_name, partition_name, hba_name)
 
     try:
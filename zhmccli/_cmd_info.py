@@ -42,7 +42,7 @@ def cmd_info(cmd_ctx):
     """
     Show information about the HMC.
     """
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     try:
         api_version = client.query_api_version()
     except zhmcclient.Error as exc:
@@ -404,7 +404,7 @@ def lpar_scsi_dump(cmd_ctx, cpc, lpar, load_address, wwpn, lun, **options):
 def cmd_lpar_list(cmd_ctx, cpc_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
 
     if client.version_info() >= (2, 20):  # Starting with HMC 2.14.0
         # This approach is faster than going through the CPC.
@@ -467,7 +467,7 @@ def cmd_lpar_list(cmd_ctx, cpc_name, options):
 def cmd_lpar_show(cmd_ctx, cpc_name, lpar_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     lpar = find_lpar(cmd_ctx, client, cpc_name, lpar_name)
 
     try:
@@ -487,7 +487,7 @@ def cmd_lpar_show(cmd_ctx, cpc_name, lpar_name, options):
 def cmd_lpar_update(cmd_ctx, cpc_name, lpar_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     lpar = find_lpar(cmd_ctx, client, cpc_name, lpar_name)
 
     name_map = {
@@ -515,7 +515,7 @@ def cmd_lpar_update(cmd_ctx, cpc_name, lpar_name, options):
 def cmd_lpar_activate(cmd_ctx, cpc_name, lpar_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     lpar = find_lpar(cmd_ctx, client, cpc_name, lpar_name)
 
     try:
@@ -530,7 +530,7 @@ def cmd_lpar_activate(cmd_ctx, cpc_name, lpar_name, options):
 def cmd_lpar_deactivate(cmd_ctx, cpc_name, lpar_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     lpar = find_lpar(cmd_ctx, client, cpc_name, lpar_name)
 
     try:
@@ -545,7 +545,7 @@ def cmd_lpar_deactivate(cmd_ctx, cpc_name, lpar_name, options):
 def cmd_lpar_load(cmd_ctx, cpc_name, lpar_name, load_address, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     lpar = find_lpar(cmd_ctx, client, cpc_name, lpar_name)
 
     try:
@@ -562,7 +562,7 @@ def cmd_lpar_console(cmd_ctx, cpc_name, lpar_name, options):
 
     logger = logging.getLogger(CONSOLE_LOGGER_NAME)
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     lpar = find_lpar(cmd_ctx, client, cpc_name, lpar_name)
 
     refresh = options['refresh']
@@ -579,7 +579,7 @@ def cmd_lpar_console(cmd_ctx, cpc_name, lpar_name, options):
 def cmd_lpar_stop(cmd_ctx, cpc_name, lpar_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     lpar = find_lpar(cmd_ctx, client, cpc_name, lpar_name)
 
     try:
@@ -594,7 +594,7 @@ def cmd_lpar_stop(cmd_ctx, cpc_name, lpar_name, options):
 def cmd_lpar_psw_restart(cmd_ctx, cpc_name, lpar_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     lpar = find_lpar(cmd_ctx, client, cpc_name, lpar_name)
 
     try:
@@ -610,7 +610,7 @@ def cmd_lpar_scsi_load(cmd_ctx, cpc_name, lpar_name, load_address,
                        wwpn, lun, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     lpar = find_lpar(cmd_ctx, client, cpc_name, lpar_name)
 
     try:
@@ -627,7 +627,7 @@ def cmd_lpar_scsi_dump(cmd_ctx, cpc_name, lpar_name, load_address,
                        wwpn, lun, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     lpar = find_lpar(cmd_ctx, client, cpc_name, lpar_name)
 
     try:
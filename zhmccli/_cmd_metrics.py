@@ -528,7 +528,7 @@ def cmd_metrics_cpc(cmd_ctx, cpc_name, options):
     # pylint: disable=missing-function-docstring,unused-argument
 
     try:
-        client = zhmcclient.Client(cmd_ctx.session)
+        client = cmd_ctx.client
 
         metric_groups = ['dpm-system-usage-overview', 'cpc-usage-overview']
         resource_filter = [
@@ -544,7 +544,7 @@ def cmd_metrics_partition(cmd_ctx, cpc_name, partition_name, options):
     # pylint: disable=missing-function-docstring,unused-argument
 
     try:
-        client = zhmcclient.Client(cmd_ctx.session)
+        client = cmd_ctx.client
 
         metric_group = 'partition-usage'
         resource_filter = [
@@ -561,7 +561,7 @@ def cmd_metrics_lpar(cmd_ctx, cpc_name, lpar_name, options):
     # pylint: disable=missing-function-docstring,unused-argument
 
     try:
-        client = zhmcclient.Client(cmd_ctx.session)
+        client = cmd_ctx.client
 
         metric_group = 'logical-partition-usage'
         resource_filter = [
@@ -578,7 +578,7 @@ def cmd_metrics_adapter(cmd_ctx, cpc_name, adapter_name, options):
     # pylint: disable=missing-function-docstring,unused-argument
 
     try:
-        client = zhmcclient.Client(cmd_ctx.session)
+        client = cmd_ctx.client
 
         metric_group = 'adapter-usage'
         resource_filter = [
@@ -595,7 +595,7 @@ def cmd_metrics_channel(cmd_ctx, cpc_name, options):
     # pylint: disable=missing-function-docstring,unused-argument
 
     try:
-        client = zhmcclient.Client(cmd_ctx.session)
+        client = cmd_ctx.client
 
         metric_group = 'channel-usage'
         resource_filter = [
@@ -611,7 +611,7 @@ def cmd_metrics_env(cmd_ctx, cpc_name, options):
     # pylint: disable=missing-function-docstring,unused-argument
 
     try:
-        client = zhmcclient.Client(cmd_ctx.session)
+        client = cmd_ctx.client
 
         metric_group = 'zcpc-environmentals-and-power'
         resource_filter = [
@@ -627,7 +627,7 @@ def cmd_metrics_proc(cmd_ctx, cpc_name, options):
     # pylint: disable=missing-function-docstring,unused-argument
 
     try:
-        client = zhmcclient.Client(cmd_ctx.session)
+        client = cmd_ctx.client
 
         metric_group = 'zcpc-processor-usage'
         resource_filter = [
@@ -643,7 +643,7 @@ def cmd_metrics_crypto(cmd_ctx, cpc_name, options):
     # pylint: disable=missing-function-docstring,unused-argument
 
     try:
-        client = zhmcclient.Client(cmd_ctx.session)
+        client = cmd_ctx.client
 
         metric_group = 'crypto-usage'
         resource_filter = [
@@ -659,7 +659,7 @@ def cmd_metrics_flash(cmd_ctx, cpc_name, options):
     # pylint: disable=missing-function-docstring,unused-argument
 
     try:
-        client = zhmcclient.Client(cmd_ctx.session)
+        client = cmd_ctx.client
 
         metric_group = 'flash-memory-usage'
         resource_filter = [
@@ -675,7 +675,7 @@ def cmd_metrics_roce(cmd_ctx, cpc_name, options):
     # pylint: disable=missing-function-docstring,unused-argument
 
     try:
-        client = zhmcclient.Client(cmd_ctx.session)
+        client = cmd_ctx.client
 
         metric_group = 'roce-usage'
         resource_filter = [
@@ -691,7 +691,7 @@ def cmd_metrics_networkport(cmd_ctx, cpc_name, adapter_name, options):
     # pylint: disable=missing-function-docstring,unused-argument
 
     try:
-        client = zhmcclient.Client(cmd_ctx.session)
+        client = cmd_ctx.client
 
         metric_group = 'network-physical-adapter-port'
         resource_filter = [
@@ -708,7 +708,7 @@ def cmd_metrics_nic(cmd_ctx, cpc_name, partition_name, nic_name, options):
     # pylint: disable=missing-function-docstring,unused-argument
 
     try:
-        client = zhmcclient.Client(cmd_ctx.session)
+        client = cmd_ctx.client
 
         metric_group = 'partition-attached-network-interface'
         resource_filter = [
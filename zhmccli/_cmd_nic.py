@@ -341,7 +341,7 @@ def backing_uri(cmd_ctx, cpc, org_options, required=False):
 def cmd_nic_list(cmd_ctx, cpc_name, partition_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
     try:
@@ -384,7 +384,7 @@ def cmd_nic_list(cmd_ctx, cpc_name, partition_name, options):
 def cmd_nic_show(cmd_ctx, cpc_name, partition_name, nic_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     nic = find_nic(cmd_ctx, client, cpc_name, partition_name, nic_name)
 
     try:
@@ -398,7 +398,7 @@ def cmd_nic_show(cmd_ctx, cpc_name, partition_name, nic_name):
 def cmd_nic_create(cmd_ctx, cpc_name, partition_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
     name_map = {
@@ -426,7 +426,7 @@ def cmd_nic_create(cmd_ctx, cpc_name, partition_name, options):
 def cmd_nic_update(cmd_ctx, cpc_name, partition_name, nic_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     nic = find_nic(cmd_ctx, client, cpc_name, partition_name, nic_name)
 
     name_map = {
@@ -465,7 +465,7 @@ def cmd_nic_update(cmd_ctx, cpc_name, partition_name, nic_name, options):
 def cmd_nic_delete(cmd_ctx, cpc_name, partition_name, nic_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     nic = find_nic(cmd_ctx, client, cpc_name, partition_name, nic_name)
 
     try:
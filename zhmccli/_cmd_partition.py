@@ -21,7 +21,11 @@ from __future__ import print_function
 
 import os
 
+import inspect
 import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import six
 import click
 
 import zhmcclient
@@ -30,7 +34,7 @@ from ._helper import print_properties, print_resources, abort_if_false, \
     options_to_properties, original_options, COMMAND_OPTIONS_METAVAR, \
     part_console, click_exception, storage_management_feature, \
     add_options, LIST_OPTIONS, TABLE_FORMATS, hide_property, \
-    ASYNC_TIMEOUT_OPTIONS
+    ASYNC_TIMEOUT_OPTIONS, MAX_CONCURRENT_OPERATIONS
 from ._cmd_cpc import find_cpc
 from ._cmd_storagegroup import find_storagegroup
 from ._cmd_metrics import get_metric_values
@@ -48,22 +52,190 @@ DEFAULT_PROCESSING_WEIGHT = 100
 MIN_PROCESSING_WEIGHT = 1
 MAX_PROCESSING_WEIGHT = 999
 
+# Buffer size in Bytes for reading ISO image files to be mounted
+ISO_IMAGE_BUFFER_SIZE = 1024 * 1024
+
+# Columns shown by the 'partition list' command, depending on its options.
+# The columns are shown in the order of these definitions.
+LIST_NAME_COLUMNS = ('name', 'cpc')
+LIST_DEFAULT_COLUMNS = ('status', 'type', 'os-name', 'os-type', 'os-version')
+LIST_URI_COLUMNS = ('object-uri',)
+LIST_MEMORY_USAGE_COLUMNS = ('initial-memory',)
+LIST_PROCESSOR_MODE_COLUMNS = ('processor-mode',)
+LIST_IFL_USAGE_COLUMNS = ('ifls', 'ifl-weight', 'ifl-capacity')
+LIST_CP_USAGE_COLUMNS = ('cps', 'cp-weight', 'cp-capacity')
+LIST_PROCESSOR_USAGE_COLUMNS = ('processor-usage', 'processors-used')
+
+# Partition properties that are returned by the partition list operations
+# without requesting them as additional properties
+LIST_PROPERTIES = [
+    'name',
+    'object-uri',
+    'status',
+    'type',
+]
+
+# Partition properties needed for the usage related options of the
+# 'partition list' command
+USAGE_PROPERTIES = [
+    'processor-mode',
+    'status',
+    'initial-ifl-processing-weight',
+    'initial-cp-processing-weight',
+    'ifl-processors',
+    'cp-processors',
+]
+
+
+# The following options of the 'partition create' and 'partition update'
+# commands are handled specifically in these commands (as opposed to be
+# handled generically in options_to_properties()):
+
+# The option for booting from a storage volume.
+# For consistency, a list is used even though it is a single option.
+BOOT_STORAGE_OPTION_NAMES = (
+    'boot-storage-volume',
+)
+
+# The deprecated options for booting from an FCP storage volume.
+# They need to be specified together, all of them are required.
+OLD_BOOT_STORAGE_OPTION_NAMES = (
+    'boot-storage-hba',
+    'boot-storage-lun',
+    'boot-storage-wwpn',
+)
+
+# The option for booting from a PXE server.
+# For consistency, a list is used even though it is a single option.
+BOOT_NETWORK_OPTION_NAMES = (
+    'boot-network-nic',
+)
+
+# The options for booting from an FTP server.
+# They need to be specified together, all of them are required.
+BOOT_FTP_OPTION_NAMES = (
+    'boot-ftp-host',
+    'boot-ftp-username',
+    'boot-ftp-password',
+    'boot-ftp-insfile',
+)
+
+# The option for booting from an HMC media file.
+# For consistency, a list is used even though it is a single option.
+BOOT_MEDIA_OPTION_NAMES = (
+    'boot-media-file',
+)
+
+# The option for booting from an HMC ISO image.
+# For consistency, a list is used even though it is a single option.
+BOOT_ISO_OPTION_NAMES = (
+    'boot-iso',
+)
+
+# Options handled specifically in the 'partition create' and 'partition update'
+# commands, as sets of option names to be skipped by options_to_properties().
+CREATE_SPECIAL_OPTION_NAMES = frozenset().union(
+    BOOT_FTP_OPTION_NAMES, BOOT_MEDIA_OPTION_NAMES)
+UPDATE_SPECIAL_OPTION_NAMES = frozenset().union(
+    BOOT_STORAGE_OPTION_NAMES, OLD_BOOT_STORAGE_OPTION_NAMES,
+    BOOT_NETWORK_OPTION_NAMES, BOOT_FTP_OPTION_NAMES,
+    BOOT_MEDIA_OPTION_NAMES, BOOT_ISO_OPTION_NAMES)
+
+
+# Click options for booting from an FTP server or from an HMC media file,
+# used for the partition create and update commands
+PARTITION_BOOT_OPTIONS = [
+    click.option('--boot-ftp-host', type=str, required=False,
+                 help='Boot from an FTP server: The hostname or IP address '
+                 'of the FTP server.'),
+    click.option('--boot-ftp-username', type=str, required=False,
+                 help='Boot from an FTP server: The user name on the FTP '
+                 'server.'),
+    click.option('--boot-ftp-password', type=str, required=False,
+                 help='Boot from an FTP server: The password on the FTP '
+                 'server.'),
+    click.option('--boot-ftp-insfile', type=str, required=False,
+                 help='Boot from an FTP server: The path to the INS-file on '
+                 'the FTP server.'),
+    click.option('--boot-media-file', type=str, required=False,
+                 help='Boot from removable media on the HMC: The path to the '
+                 'image file on the HMC.'),
+]
+
+# Click options for authorization controls, used for the partition create
+# and update commands
+PARTITION_ACCESS_OPTIONS = [
+    click.option('--access-global-performance-data', type=bool,
+                 required=False,
+                 help='Indicates if global performance data authorization '
+                 'control is requested. Default: False'),
+    click.option('--permit-cross-partition-commands', type=bool,
+                 required=False,
+                 help='Indicates if cross partition commands authorization is'
+                 'requested. Default: False'),
+    click.option('--access-basic-counter-set', type=bool, required=False,
+                 help='Indicates if basic counter set authorization control '
+                 'is requested. Default: False'),
+    click.option('--access-problem-state-counter-set', type=bool,
+                 required=False,
+                 help='Indicates if problem state counter set authorization '
+                 'is requested. Default: False'),
+    click.option('--access-crypto-activity-counter-set',
+                 type=bool, required=False,
+                 help='Indicates is crypto activity counter set authorization '
+                 'control is requested. Default: False'),
+    click.option('--access-extended-counter-set', type=bool, required=False,
+                 help='Indicates if extended counter set authorization '
+                 'control is requested. Default: False'),
+    click.option('--access-coprocessor-group-set', type=bool, required=False,
+                 help='Indicates if coprocessor group set authorization '
+                 'control is requested. Default: False'),
+    click.option('--access-basic-sampling', type=bool, required=False,
+                 help='Indicates if basic CPU sampling authorization control '
+                 'is requested. Default: False'),
+    click.option('--access-diagnostic-sampling', type=bool, required=False,
+                 help='Indicates if diagnostic sampling authorization control '
+                 'is requested. Default: False'),
+]
+
+# Click options for the network settings of Secure Service Container
+# partitions, used for the partition create and update commands
+PARTITION_SSC_NETWORK_OPTIONS = [
+    click.option('--ssc-ipv4-gateway', type=str, required=False,
+                 help='Default IPv4 Gateway to be used. '
+                 'Only applicable to ssc type partitions.'),
+    click.option('--ssc-dns-servers', type=str, required=False,
+                 help='DNS IP address information. '
+                 'Only applicable to ssc type partitions.'),
+]
+
 
 def find_partition(cmd_ctx, client, cpc_or_name, partition_name):
     """
     Find a partition by name and return its resource object.
+
+    The partition is cached in the command context, so that repeated lookups
+    of the same partition do not cause repeated HMC operations.
     """
     if isinstance(cpc_or_name, zhmcclient.Cpc):
         cpc_name = cpc_or_name.name
     else:
         cpc_name = cpc_or_name
 
+    cache_key = ('partition', cpc_name, partition_name)
+    partition = cmd_ctx.resource_cache.get(cache_key, None)
+    if partition is not None:
+        return partition
+
     if client.version_info() >= (2, 20):  # Starting with HMC 2.14.0
         # This approach is faster than going through the CPC.
         # In addition, this approach supports users that do not have object
         # access permission to the parent CPC of the LPAR.
-        partitions = client.consoles.console.list_permitted_partitions(
-            filter_args={'name': partition_name, 'cpc-name': cpc_name})
+        try:
+            partitions = client.consoles.console.list_permitted_partitions(
+                filter_args={'name': partition_name, 'cpc-name': cpc_name})
+        except zhmcclient.Error as exc:
+            raise click_exception(exc, cmd_ctx.error_format)
         if len(partitions) != 1:
             raise click_exception(
                 "Partition not found: {}".format(partition_name),
@@ -81,9 +253,195 @@ def find_partition(cmd_ctx, client, cpc_or_name, partition_name):
         except zhmcclient.Error as exc:
             raise click_exception(exc, cmd_ctx.error_format)
 
+    cmd_ctx.resource_cache[cache_key] = partition
     return partition
 
 
+def uncache_partition(cmd_ctx, cpc_name, partition_name):
+    """
+    Remove a partition from the cache in the command context, if cached.
+
+    This needs to be done when the partition is deleted or renamed.
+    """
+    cmd_ctx.resource_cache.pop(('partition', cpc_name, partition_name), None)
+
+
+def has_parameter(func, name):
+    """
+    Return a boolean indicating whether a function or method has a parameter
+    with the specified name.
+
+    This is used to determine whether the installed zhmcclient version
+    supports a parameter of one of its methods.
+    """
+    try:
+        signature = inspect.signature
+    except AttributeError:
+        # Python 2.7
+        # pylint: disable=deprecated-method
+        return name in inspect.getargspec(func).args
+    return name in signature(func).parameters
+
+
+def list_with_properties(list_method, filter_args, additional_properties):
+    """
+    Invoke a list method of zhmcclient with the specified filter arguments,
+    and request the specified additional properties to be returned in the
+    listed resource objects.
+
+    The additional properties are requested only if the installed zhmcclient
+    version supports that. If the HMC rejects the request because it does
+    not support additional properties (HTTP status 400, reason 1), the list
+    method is invoked again without them. Older HMCs may also simply ignore
+    the additional properties, so the caller still needs to deal with
+    resource objects that do not have them.
+
+    Parameters:
+
+      list_method (callable): The list method, e.g.
+        `zhmcclient.PartitionManager.list`.
+
+      filter_args (dict): Filter arguments, or `None`.
+
+      additional_properties (list of string): Names of the additional
+        properties, or `None`.
+
+    Returns:
+
+      list of resource objects: The listed resources.
+    """
+    if additional_properties and \
+            has_parameter(list_method, 'additional_properties'):
+        try:
+            return list_method(filter_args=filter_args,
+                               additional_properties=additional_properties)
+        except zhmcclient.HTTPError as exc:
+            if exc.http_status != 400 or exc.reason != 1:
+                raise
+            # The HMC does not support the additional-properties query
+            # parameter.
+    return list_method(filter_args=filter_args)
+
+
+def used_and_missing_options(org_options, option_names):
+    """
+    Return the options of a group of options that are used (i.e. specified)
+    and those that are missing, in one pass over the option names.
+
+    Parameters:
+
+      org_options (dict): The options of the command, with their original
+        names.
+
+      option_names (iterable of string): The original names of the options
+        in the group.
+
+    Returns:
+
+      tuple (used, missing), with:
+      - used (list of string): The used options, as '--name'.
+      - missing (list of string): The missing options, as '--name'.
+    """
+    used = []
+    missing = []
+    for name in option_names:
+        if org_options[name] is None:
+            missing.append('--' + name)
+        else:
+            used.append('--' + name)
+    return used, missing
+
+
+def process_partitions(cmd_ctx, partition_names, func):
+    """
+    Perform an operation on one or more partitions and display the result
+    messages.
+
+    Duplicate partition names are ignored. Multiple partitions are processed
+    concurrently, with at most MAX_CONCURRENT_OPERATIONS operations at a time.
+    The result messages are displayed in the order of the specified
+    partitions. Errors for individual partitions do not stop the processing
+    of the other partitions; they are prefixed with the partition name and
+    raised together as one click exception at the end.
+
+    Parameters:
+
+      cmd_ctx (CmdContext): Context object of the command.
+
+      partition_names (iterable of string): The names of the partitions.
+
+      func (callable): Function that performs the operation on one partition.
+        It is called with the partition name as its only argument, returns
+        the result message, and raises click.ClickException or
+        zhmcclient.Error for errors.
+    """
+    # Remove duplicate partition names, keeping their order
+    partition_names = list(OrderedDict.fromkeys(partition_names))
+
+    if len(partition_names) == 1:
+        try:
+            message = func(partition_names[0])
+        except zhmcclient.Error as exc:
+            raise click_exception(exc, cmd_ctx.error_format)
+        cmd_ctx.spinner.stop()
+        click.echo(message)
+        return
+
+    # The worker threads share the client and session of the command context.
+    # Both are created lazily and logging on to the HMC is not thread-safe,
+    # so the client is created and a real session is logged on before the
+    # worker threads are started. Otherwise, each worker thread would prompt
+    # for the password and create its own HMC session.
+    cmd_ctx.client  # pylint: disable=pointless-statement
+    if cmd_ctx.session_id is None or \
+            isinstance(cmd_ctx.session_id, six.string_types):
+        try:
+            cmd_ctx.session.logon()
+        except zhmcclient.Error as exc:
+            raise click_exception(exc, cmd_ctx.error_format)
+
+    max_workers = min(MAX_CONCURRENT_OPERATIONS, len(partition_names))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(func, name) for name in partition_names]
+    messages = []
+    errors = []
+    for name, future in zip(partition_names, futures):
+        try:
+            messages.append(future.result())
+        except click.ClickException as exc:
+            errors.append("Partition {p}: {m}".format(p=name, m=exc.message))
+        except zhmcclient.Error as exc:
+            errors.append("Partition {p}: {m}".format(
+                p=name, m=click_exception(exc, cmd_ctx.error_format).message))
+
+    cmd_ctx.spinner.stop()
+    for message in messages:
+        click.echo(message)
+    if errors:
+        raise click.ClickException('\n'.join(errors))
+
+
+def pull_properties(resource, properties):
+    """
+    Retrieve the specified properties of a resource from the HMC and cache
+    them in the resource object.
+
+    Only the specified properties are retrieved if the installed zhmcclient
+    version supports that. Otherwise, the full set of properties is
+    retrieved.
+
+    Parameters:
+
+      resource (zhmcclient.BaseResource): The resource object.
+
+      properties (list of string): Names of the properties.
+    """
+    if hasattr(resource, 'pull_properties'):
+        resource.pull_properties(properties)
+    else:
+        resource.pull_full_properties()
+
+
 @cli.group('partition', options_metavar=COMMAND_OPTIONS_METAVAR)
 def partition_group():
     """
@@ -152,36 +510,42 @@ def partition_show(cmd_ctx, cpc, partition, **options):
 
 @partition_group.command('start', options_metavar=COMMAND_OPTIONS_METAVAR)
 @click.argument('CPC', type=str, metavar='CPC')
-@click.argument('PARTITION', type=str, metavar='PARTITION')
+@click.argument('PARTITIONS', type=str, metavar='PARTITION...', nargs=-1,
+                required=True)
 @add_options(ASYNC_TIMEOUT_OPTIONS)
 @click.pass_obj
-def partition_start(cmd_ctx, cpc, partition, **options):
+def partition_start(cmd_ctx, cpc, partitions, **options):
     """
-    Start a partition.
+    Start one or more partitions.
+
+    If multiple partitions are specified, they are started concurrently.
 
     In addition to the command-specific options shown in this help text, the
     general options (see 'zhmc --help') can also be specified right after the
     'zhmc' command name.
     """
     cmd_ctx.execute_cmd(lambda: cmd_partition_start(
-        cmd_ctx, cpc, partition, options))
+        cmd_ctx, cpc, partitions, options))
 
 
 @partition_group.command('stop', options_metavar=COMMAND_OPTIONS_METAVAR)
 @click.argument('CPC', type=str, metavar='CPC')
-@click.argument('PARTITION', type=str, metavar='PARTITION')
+@click.argument('PARTITIONS', type=str, metavar='PARTITION...', nargs=-1,
+                required=True)
 @add_options(ASYNC_TIMEOUT_OPTIONS)
 @click.pass_obj
-def partition_stop(cmd_ctx, cpc, partition, **options):
+def partition_stop(cmd_ctx, cpc, partitions, **options):
     """
-    Stop a partition.
+    Stop one or more partitions.
+
+    If multiple partitions are specified, they are stopped concurrently.
 
     In addition to the command-specific options shown in this help text, the
     general options (see 'zhmc --help') can also be specified right after the
     'zhmc' command name.
     """
     cmd_ctx.execute_cmd(lambda: cmd_partition_stop(
-        cmd_ctx, cpc, partition, options))
+        cmd_ctx, cpc, partitions, options))
 
 
 @partition_group.command('dump', options_metavar=COMMAND_OPTIONS_METAVAR)
@@ -264,59 +628,15 @@ def partition_dump(cmd_ctx, cpc, partition, **options):
               help='The maximum amount of memory (in MiB) while the partition '
               'is running. '
               'Default: {d} MiB'.format(d=DEFAULT_MAXIMUM_MEMORY_MB))
-@click.option('--boot-ftp-host', type=str, required=False,
-              help='Boot from an FTP server: The hostname or IP address of '
-              'the FTP server.')
-@click.option('--boot-ftp-username', type=str, required=False,
-              help='Boot from an FTP server: The user name on the FTP server.')
-@click.option('--boot-ftp-password', type=str, required=False,
-              help='Boot from an FTP server: The password on the FTP server.')
-@click.option('--boot-ftp-insfile', type=str, required=False,
-              help='Boot from an FTP server: The path to the INS-file on the '
-              'FTP server.')
-@click.option('--boot-media-file', type=str, required=False,
-              help='Boot from removable media on the HMC: The path to the '
-              'image file on the HMC.')
-@click.option('--access-global-performance-data', type=bool, required=False,
-              help='Indicates if global performance data authorization '
-              'control is requested. Default: False')
-@click.option('--permit-cross-partition-commands', type=bool, required=False,
-              help='Indicates if cross partition commands authorization is'
-              'requested. Default: False')
-@click.option('--access-basic-counter-set', type=bool, required=False,
-              help='Indicates if basic counter set authorization control is '
-              'requested. Default: False')
-@click.option('--access-problem-state-counter-set', type=bool, required=False,
-              help='Indicates if problem state counter set authorization '
-              'is requested. Default: False')
-@click.option('--access-crypto-activity-counter-set',
-              type=bool, required=False,
-              help='Indicates is crypto activity counter set authorization '
-              'control is requested. Default: False')
-@click.option('--access-extended-counter-set', type=bool, required=False,
-              help='Indicates if extended counter set authorization control '
-              'is requested. Default: False')
-@click.option('--access-coprocessor-group-set', type=bool, required=False,
-              help='Indicates if coprocessor group set authorization control '
-              'is requested. Default: False')
-@click.option('--access-basic-sampling', type=bool, required=False,
-              help='Indicates if basic CPU sampling authorization control is '
-              'requested. Default: False')
-@click.option('--access-diagnostic-sampling', type=bool, required=False,
-              help='Indicates if diagnostic sampling authorization control '
-              'is requested. Default: False')
+@add_options(PARTITION_BOOT_OPTIONS)
+@add_options(PARTITION_ACCESS_OPTIONS)
 @click.option('--type', type=click.Choice(PARTITION_TYPES), required=False,
               help='Defines the type of the partition (Default: {pd}).'.
               format(pd=DEFAULT_PARTITION_TYPE))
 @click.option('--ssc-host-name', type=str, required=False,
               help='Secure Service Container host name. '
               'Only applicable to and required for ssc type partitions.')
-@click.option('--ssc-ipv4-gateway', type=str, required=False,
-              help='Default IPv4 Gateway to be used. '
-              'Only applicable to ssc type partitions.')
-@click.option('--ssc-dns-servers', type=str, required=False,
-              help='DNS IP address information. '
-              'Only applicable to ssc type partitions.')
+@add_options(PARTITION_SSC_NETWORK_OPTIONS)
 @click.option('--ssc-master-userid', type=str, required=False,
               help='Secure Service Container master user ID. '
               'Only applicable to and required for ssc type partitions.')
@@ -377,9 +697,11 @@ def partition_create(cmd_ctx, cpc, **options):
 
 @partition_group.command('update', options_metavar=COMMAND_OPTIONS_METAVAR)
 @click.argument('CPC', type=str, metavar='CPC')
-@click.argument('PARTITION', type=str, metavar='PARTITION')
+@click.argument('PARTITIONS', type=str, metavar='PARTITION...', nargs=-1,
+                required=True)
 @click.option('--name', type=str, required=False,
-              help='The new name of the partition.')
+              help='The new name of the partition. Can only be specified '
+              'when updating a single partition.')
 @click.option('--description', type=str, required=False,
               help='The new description of the partition.')
 @click.option('--cp-processors', type=int, required=False,
@@ -423,49 +745,10 @@ def partition_create(cmd_ctx, cpc, **options):
               'Deprecated, use --boot-storage-volume instead.')
 @click.option('--boot-network-nic', type=str, required=False,
               help='Boot from a PXE server: The name of the NIC to be used.')
-@click.option('--boot-ftp-host', type=str, required=False,
-              help='Boot from an FTP server: The hostname or IP address of '
-              'the FTP server.')
-@click.option('--boot-ftp-username', type=str, required=False,
-              help='Boot from an FTP server: The user name on the FTP server.')
-@click.option('--boot-ftp-password', type=str, required=False,
-              help='Boot from an FTP server: The password on the FTP server.')
-@click.option('--boot-ftp-insfile', type=str, required=False,
-              help='Boot from an FTP server: The path to the INS-file on the '
-              'FTP server.')
-@click.option('--boot-media-file', type=str, required=False,
-              help='Boot from removable media on the HMC: The path to the '
-              'image file on the HMC.')
+@add_options(PARTITION_BOOT_OPTIONS)
 @click.option('--boot-iso', type=str, required=False,
               help='Boot from an ISO image mounted to this partition.')
-@click.option('--access-global-performance-data', type=bool, required=False,
-              help='Indicates if global performance data authorization '
-              'control is requested. Default: False')
-@click.option('--permit-cross-partition-commands', type=bool, required=False,
-              help='Indicates if cross partition commands authorization is'
-              'requested. Default: False')
-@click.option('--access-basic-counter-set', type=bool, required=False,
-              help='Indicates if basic counter set authorization control is '
-              'requested. Default: False')
-@click.option('--access-problem-state-counter-set', type=bool, required=False,
-              help='Indicates if problem state counter set authorization '
-              'is requested. Default: False')
-@click.option('--access-crypto-activity-counter-set',
-              type=bool, required=False,
-              help='Indicates is crypto activity counter set authorization '
-              'control is requested. Default: False')
-@click.option('--access-extended-counter-set', type=bool, required=False,
-              help='Indicates if extended counter set authorization control '
-              'is requested. Default: False')
-@click.option('--access-coprocessor-group-set', type=bool, required=False,
-              help='Indicates if coprocessor group set authorization control '
-              'is requested. Default: False')
-@click.option('--access-basic-sampling', type=bool, required=False,
-              help='Indicates if basic CPU sampling authorization control is '
-              'requested. Default: False')
-@click.option('--access-diagnostic-sampling', type=bool, required=False,
-              help='Indicates if diagnostic sampling authorization control '
-              'is requested. Default: False')
+@add_options(PARTITION_ACCESS_OPTIONS)
 @click.option('--ssc-host-name', type=str, required=False,
               help='Secure Service Container host name.')
 @click.option('--ssc-boot-selection',
@@ -473,12 +756,7 @@ def partition_create(cmd_ctx, cpc, **options):
               help='Set the boot mode of the Secure Service Container '
               'to run the SSC Appliance Installer again upon next '
               'partition start. Only applicable to ssc type partitions.')
-@click.option('--ssc-ipv4-gateway', type=str, required=False,
-              help='Default IPv4 Gateway to be used. '
-              'Only applicable to ssc type partitions.')
-@click.option('--ssc-dns-servers', type=str, required=False,
-              help='DNS IP address information. '
-              'Only applicable to ssc type partitions.')
+@add_options(PARTITION_SSC_NETWORK_OPTIONS)
 @click.option('--ssc-master-userid', type=str, required=False,
               help='Secure Service Container master user ID. '
               'Only applicable to ssc type partitions.')
@@ -514,18 +792,21 @@ def partition_create(cmd_ctx, cpc, **options):
               help='Represents the maximum amount of general purpose '
               'processor resources allocated to the partition.')
 @click.pass_obj
-def partition_update(cmd_ctx, cpc, partition, **options):
+def partition_update(cmd_ctx, cpc, partitions, **options):
     """
-    Update the properties of a partition.
+    Update the properties of one or more partitions.
 
     Only the properties will be changed for which a corresponding option is
     specified, so the default for all options is not to change properties.
 
+    If multiple partitions are specified, they are updated concurrently, with
+    the same options.
+
     In addition to the command-specific options shown in this help text, the
     general options (see 'zhmc --help') can also be specified right after the
     'zhmc' command name.
     """
-    cmd_ctx.execute_cmd(lambda: cmd_partition_update(cmd_ctx, cpc, partition,
+    cmd_ctx.execute_cmd(lambda: cmd_partition_update(cmd_ctx, cpc, partitions,
                                                      options))
 
 
@@ -715,7 +996,48 @@ Help for usage related options of the partition list command:
         click.echo(help_lines)
         return
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
+
+    # Prepare the additions dict of dicts. It contains additional
+    # (=non-resource) property values by property name and by resource URI.
+    # Depending on options, some of them will not be populated.
+    additions = {}
+    additions['ifl-capacity'] = {}
+    additions['ifls'] = {}
+    additions['ifl-weight'] = {}
+    additions['cp-capacity'] = {}
+    additions['cps'] = {}
+    additions['cp-weight'] = {}
+    additions['processor-usage'] = {}
+    additions['processors-used'] = {}
+    additions['cpc'] = {}
+
+    show_list = list(LIST_NAME_COLUMNS)
+    if not options['names_only']:
+        show_list.extend(LIST_DEFAULT_COLUMNS)
+    if options['uri']:
+        show_list.extend(LIST_URI_COLUMNS)
+    if options['memory_usage']:
+        show_list.extend(LIST_MEMORY_USAGE_COLUMNS)
+    if options['ifl_usage'] or options['cp_usage']:
+        show_list.extend(LIST_PROCESSOR_MODE_COLUMNS)
+        if options['ifl_usage']:
+            show_list.extend(LIST_IFL_USAGE_COLUMNS)
+        if options['cp_usage']:
+            show_list.extend(LIST_CP_USAGE_COLUMNS)
+        show_list.extend(LIST_PROCESSOR_USAGE_COLUMNS)
+
+    # The shown properties that are not returned by the list operations by
+    # default are requested as additional properties in the list operations,
+    # so that they do not need to be retrieved for each partition.
+    additional_properties = [
+        name for name in show_list
+        if name not in additions and name not in LIST_PROPERTIES]
+    if options['ifl_usage'] or options['cp_usage']:
+        for name in USAGE_PROPERTIES:
+            if name not in additional_properties \
+                    and name not in LIST_PROPERTIES:
+                additional_properties.append(name)
 
     if client.version_info() >= (2, 20):  # Starting with HMC 2.14.0
         # This approach is faster than going through the CPC.
@@ -724,8 +1046,12 @@ Help for usage related options of the partition list command:
         filter_args = {}
         if cpc_name:
             filter_args['cpc-name'] = cpc_name
-        partitions = client.consoles.console.list_permitted_partitions(
-            filter_args=filter_args)
+        try:
+            partitions = list_with_properties(
+                client.consoles.console.list_permitted_partitions,
+                filter_args, additional_properties)
+        except zhmcclient.Error as exc:
+            raise click_exception(exc, cmd_ctx.error_format)
     else:
         filter_args = {}
         if cpc_name:
@@ -737,7 +1063,8 @@ Help for usage related options of the partition list command:
         partitions = []
         for cpc in cpcs:
             try:
-                partitions.extend(cpc.partitions.list())
+                partitions.extend(list_with_properties(
+                    cpc.partitions.list, None, additional_properties))
             except zhmcclient.Error as exc:
                 raise click_exception(exc, cmd_ctx.error_format)
 
@@ -745,144 +1072,115 @@ Help for usage related options of the partition list command:
         click.echo("The --type option is deprecated and type information "
                    "is now always shown.")
 
-    # Prepare the additions dict of dicts. It contains additional
-    # (=non-resource) property values by property name and by resource URI.
-    # Depending on options, some of them will not be populated.
-    additions = {}
-    additions['ifl-capacity'] = {}
-    additions['ifls'] = {}
-    additions['ifl-weight'] = {}
-    additions['cp-capacity'] = {}
-    additions['cps'] = {}
-    additions['cp-weight'] = {}
-    additions['processor-usage'] = {}
-    additions['processors-used'] = {}
-    additions['cpc'] = {}
-
-    show_list = [
-        'name',
-        'cpc',
-    ]
-    if not options['names_only']:
-        show_list.extend([
-            'status',
-            'type',
-            'os-name',
-            'os-type',
-            'os-version',
-        ])
-    if options['uri']:
-        show_list.extend([
-            'object-uri',
-        ])
-
-    if options['memory_usage']:
-        show_list.extend([
-            'initial-memory',
-        ])
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_OPERATIONS) \
+            as executor:
+
+        if options['ifl_usage'] or options['cp_usage']:
+            # The processor-usage metrics do not depend on the partition
+            # properties, so they are retrieved concurrently with the
+            # retrieval of the partition properties below.
+            # The metric values are retrieved for all partitions in one HMC
+            # operation and are matched to the listed partitions by their
+            # URIs. This avoids filtering by CPC, which needs to look up the
+            # partition of each metric value on the HMC.
+            metrics_future = executor.submit(
+                get_metric_values, client, 'partition-usage', [])
+
+        # Retrieve the full properties of the partitions for which the list
+        # operation did not return the additional properties (i.e. on older
+        # zhmcclient or HMC versions). This needs one HMC operation per
+        # partition, so it is performed concurrently.
+        pull_partitions = [
+            p for p in partitions
+            if any(name not in p.properties
+                   for name in additional_properties)]
+        if pull_partitions:
+            try:
+                list(executor.map(lambda p: p.pull_full_properties(),
+                                  pull_partitions))
+            except zhmcclient.Error as exc:
+                raise click_exception(exc, cmd_ctx.error_format)
 
     if options['ifl_usage'] or options['cp_usage']:
 
-        for p in partitions:
-            p.pull_full_properties()
-
-        # Calculate effective IFLs and add it
+        # Calculate the total IFL and CP weights of the active partitions
+        # in shared processor mode, and the total number of IFLs and CPs
         total_ifls = {}  # by CPC name
         total_ifl_weight = {}  # by CPC name
+        total_cps = {}  # by CPC name
+        total_cp_weight = {}  # by CPC name
         for p in partitions:
-            cpc = p.manager.parent
-            if p.properties['processor-mode'] == 'shared' and \
-                    p.properties['status'] == 'active':
+            props = p.properties
+            if props['processor-mode'] == 'shared' and \
+                    props['status'] == 'active':
+                cpc = p.manager.parent
                 if cpc.name not in total_ifl_weight:
                     total_ifl_weight[cpc.name] = 0
                     total_ifls[cpc.name] = cpc.prop('processor-count-ifl')
-                total_ifl_weight[cpc.name] += \
-                    p.properties['initial-ifl-processing-weight']
-        for p in partitions:
-            cpc = p.manager.parent
-            if p.properties['status'] != 'active':
-                ifls_eff = None
-            elif p.properties['processor-mode'] == 'shared':
-                ifl_weight = p.properties['initial-ifl-processing-weight']
-                ifls_eff = float(total_ifls[cpc.name]) * ifl_weight / \
-                    total_ifl_weight[cpc.name]
-            else:
-                ifls_eff = float(p.properties['ifl-processors'])
-            additions['ifl-capacity'][p.uri] = ifls_eff
-            additions['ifls'][p.uri] = p.properties['ifl-processors']
-            additions['ifl-weight'][p.uri] = \
-                p.properties['initial-ifl-processing-weight']
-
-        # Calculate effective CPs and add it
-        total_cps = {}  # by CPC name
-        total_cp_weight = {}  # by CPC name
-        for p in partitions:
-            cpc = p.manager.parent
-            if p.properties['processor-mode'] == 'shared' and \
-                    p.properties['status'] == 'active':
-                if cpc.name not in total_cp_weight:
                     total_cp_weight[cpc.name] = 0
                     total_cps[cpc.name] = \
                         cpc.prop('processor-count-general-purpose')
+                total_ifl_weight[cpc.name] += \
+                    props['initial-ifl-processing-weight']
                 total_cp_weight[cpc.name] += \
-                    p.properties['initial-cp-processing-weight']
+                    props['initial-cp-processing-weight']
+
+        # Calculate the capacity per weight unit, by CPC name
+        ifl_factor = {}
+        for name, weight in six.iteritems(total_ifl_weight):
+            ifl_factor[name] = \
+                float(total_ifls[name]) / weight if weight else 0.0
+        cp_factor = {}
+        for name, weight in six.iteritems(total_cp_weight):
+            cp_factor[name] = \
+                float(total_cps[name]) / weight if weight else 0.0
+
+        # Calculate effective IFLs and CPs and add them
         for p in partitions:
-            cpc = p.manager.parent
-            if p.properties['status'] != 'active':
+            props = p.properties
+            if props['status'] != 'active':
+                ifls_eff = None
                 cps_eff = None
-            elif p.properties['processor-mode'] == 'shared':
-                cp_weight = p.properties['initial-cp-processing-weight']
-                cps_eff = float(total_cps[cpc.name]) * cp_weight / \
-                    total_cp_weight[cpc.name]
+            elif props['processor-mode'] == 'shared':
+                cpc = p.manager.parent
+                ifls_eff = ifl_factor[cpc.name] * \
+                    props['initial-ifl-processing-weight']
+                cps_eff = cp_factor[cpc.name] * \
+                    props['initial-cp-processing-weight']
             else:
-                cps_eff = float(p.properties['cp-processors'])
+                ifls_eff = float(props['ifl-processors'])
+                cps_eff = float(props['cp-processors'])
+            additions['ifl-capacity'][p.uri] = ifls_eff
+            additions['ifls'][p.uri] = props['ifl-processors']
+            additions['ifl-weight'][p.uri] = \
+                props['initial-ifl-processing-weight']
             additions['cp-capacity'][p.uri] = cps_eff
-            additions['cps'][p.uri] = p.properties['cp-processors']
+            additions['cps'][p.uri] = props['cp-processors']
             additions['cp-weight'][p.uri] = \
-                p.properties['initial-cp-processing-weight']
+                props['initial-cp-processing-weight']
 
         # Get processor-usage metrics and add it
-        metric_group = 'partition-usage'
-        resource_filter = []
-        if cpc_name:
-            resource_filter.append(('cpc', cpc_name))
-        mov_list, _ = get_metric_values(
-            client, metric_group, resource_filter)
-        partition_metrics = dict()
-        for mov in mov_list:
-            assert isinstance(mov.resource, zhmcclient.Partition)
-            p_name = mov.resource.name
-            partition_metrics[p_name] = mov.metrics
+        mov_list, _ = metrics_future.result()
+        partition_metrics = dict(
+            (mov.resource_uri, mov.metrics) for mov in mov_list)
+        ifl_capacity = additions['ifl-capacity']
+        cp_capacity = additions['cp-capacity']
+        processor_usage = additions['processor-usage']
+        processors_used = additions['processors-used']
         for p in partitions:
+            uri = p.uri
             # Note: Partitions that are stopped have no metrics value for
             # partition-usage.
-            p_metrics = partition_metrics.get(p.name, None)
+            p_metrics = partition_metrics.get(uri, None)
             if p_metrics:
                 usage = p_metrics['processor-usage']
                 # Independent of sharing mode:
-                procs_eff = (additions['ifl-capacity'][p.uri] or 0) + \
-                    (additions['cp-capacity'][p.uri] or 0)
-                used = float(usage) / 100 * procs_eff
+                procs_eff = (ifl_capacity[uri] or 0) + (cp_capacity[uri] or 0)
+                processor_usage[uri] = usage
+                processors_used[uri] = float(usage) / 100 * procs_eff
             else:
-                usage = None
-                used = None
-            additions['processor-usage'][p.uri] = usage
-            additions['processors-used'][p.uri] = used
-
-        show_list.append('processor-mode')
-
-        if options['ifl_usage']:
-            show_list.append('ifls')
-            show_list.append('ifl-weight')
-            show_list.append('ifl-capacity')
-
-        if options['cp_usage']:
-            show_list.append('cps')
-            show_list.append('cp-weight')
-            show_list.append('cp-capacity')
-
-        show_list.append('processor-usage')
-        show_list.append('processors-used')
+                processor_usage[uri] = None
+                processors_used[uri] = None
 
     for p in partitions:
         cpc = p.manager.parent
@@ -895,7 +1193,7 @@ Help for usage related options of the partition list command:
 def cmd_partition_show(cmd_ctx, cpc_name, partition_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
     try:
@@ -912,10 +1210,13 @@ def cmd_partition_show(cmd_ctx, cpc_name, partition_name, options):
     print_properties(cmd_ctx, properties, cmd_ctx.output_format)
 
 
-def cmd_partition_start(cmd_ctx, cpc_name, partition_name, options):
-    # pylint: disable=missing-function-docstring
+def start_partition(cmd_ctx, cpc_name, partition_name, options):
+    """
+    Start a partition and return the message to be displayed for the result.
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    Errors are raised as click exceptions.
+    """
+    client = cmd_ctx.client
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
     try:
@@ -924,14 +1225,24 @@ def cmd_partition_start(cmd_ctx, cpc_name, partition_name, options):
     except zhmcclient.Error as exc:
         raise click_exception(exc, cmd_ctx.error_format)
 
-    cmd_ctx.spinner.stop()
-    click.echo("Partition {p} has been started.".format(p=partition_name))
+    return "Partition {p} has been started.".format(p=partition_name)
 
 
-def cmd_partition_stop(cmd_ctx, cpc_name, partition_name, options):
+def cmd_partition_start(cmd_ctx, cpc_name, partition_names, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    process_partitions(
+        cmd_ctx, partition_names,
+        lambda name: start_partition(cmd_ctx, cpc_name, name, options))
+
+
+def stop_partition(cmd_ctx, cpc_name, partition_name, options):
+    """
+    Stop a partition and return the message to be displayed for the result.
+
+    Errors are raised as click exceptions.
+    """
+    client = cmd_ctx.client
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
     try:
@@ -940,51 +1251,33 @@ def cmd_partition_stop(cmd_ctx, cpc_name, partition_name, options):
     except zhmcclient.Error as exc:
         raise click_exception(exc, cmd_ctx.error_format)
 
-    cmd_ctx.spinner.stop()
-    click.echo("Partition {p} has been stopped.".format(p=partition_name))
+    return "Partition {p} has been stopped.".format(p=partition_name)
 
 
-def cmd_partition_create(cmd_ctx, cpc_name, options):
+def cmd_partition_stop(cmd_ctx, cpc_name, partition_names, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
-    cpc = find_cpc(cmd_ctx, client, cpc_name)
+    process_partitions(
+        cmd_ctx, partition_names,
+        lambda name: stop_partition(cmd_ctx, cpc_name, name, options))
 
-    # The following options are handled specifically in this function (as
-    # opposed to be handled generically in options_to_properties()):
 
-    # The options for booting from an FTP server.
-    # They need to be specified together, all of them are required.
-    boot_ftp_option_names = (
-        'boot-ftp-host',
-        'boot-ftp-username',
-        'boot-ftp-password',
-        'boot-ftp-insfile',
-    )
-
-    # The option for booting from an HMC media file.
-    # For consistency, a list is used even though it is a single option.
-    boot_media_option_names = (
-        'boot-media-file',
-    )
+def cmd_partition_create(cmd_ctx, cpc_name, options):
+    # pylint: disable=missing-function-docstring
 
-    # Options handled in this function
-    special_opt_names = boot_ftp_option_names + boot_media_option_names
-    name_map = dict((opt, None) for opt in special_opt_names)
+    client = cmd_ctx.client
+    cpc = find_cpc(cmd_ctx, client, cpc_name)
 
     org_options = original_options(options)
-    properties = options_to_properties(org_options, name_map)
+    properties = options_to_properties(
+        org_options, skip_names=CREATE_SPECIAL_OPTION_NAMES)
 
     # Used and missing options handled in this function
-    used_boot_ftp_opts = [
-        '--' + name for name in boot_ftp_option_names
-        if org_options[name] is not None]
-    missing_boot_ftp_opts = [
-        '--' + name for name in boot_ftp_option_names
-        if org_options[name] is None]
+    used_boot_ftp_opts, missing_boot_ftp_opts = used_and_missing_options(
+        org_options, BOOT_FTP_OPTION_NAMES)
 
     used_boot_media_opts = [
-        '--' + name for name in boot_media_option_names
+        '--' + name for name in BOOT_MEDIA_OPTION_NAMES
         if org_options[name] is not None]
 
     used_boot_opts = used_boot_ftp_opts + used_boot_media_opts
@@ -1035,95 +1328,47 @@ def cmd_partition_create(cmd_ctx, cpc_name, options):
                format(p=new_partition.properties['name']))
 
 
-def cmd_partition_update(cmd_ctx, cpc_name, partition_name, options):
-    # pylint: disable=missing-function-docstring
+def check_update_boot_options(cmd_ctx, org_options):
+    """
+    Check the boot options of the 'partition update' command, and return the
+    group of boot options that is used.
 
-    client = zhmcclient.Client(cmd_ctx.session)
-    partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
+    The checks depend only on the options, so they are performed once for
+    all partitions to be updated. Errors are raised as click exceptions.
 
-    # The following options are handled specifically in this function (as
-    # opposed to be handled generically in options_to_properties()):
-
-    # The option for booting from a storage volume.
-    # For consistency, a list is used even though it is a single option.
-    boot_storage_option_names = (
-        'boot-storage-volume',
-    )
-
-    # The deprecated options for booting from an FCP storage volume.
-    # They need to be specified together, all of them are required.
-    old_boot_storage_option_names = (
-        'boot-storage-hba',
-        'boot-storage-lun',
-        'boot-storage-wwpn',
-    )
-
-    # The option for booting from a PXE server.
-    # For consistency, a list is used even though it is a single option.
-    boot_network_option_names = (
-        'boot-network-nic',
-    )
-
-    # The options for booting from an FTP server.
-    # They need to be specified together, all of them are required.
-    boot_ftp_option_names = (
-        'boot-ftp-host',
-        'boot-ftp-username',
-        'boot-ftp-password',
-        'boot-ftp-insfile',
-    )
-
-    # The option for booting from an HMC media file.
-    # For consistency, a list is used even though it is a single option.
-    boot_media_option_names = (
-        'boot-media-file',
-    )
-
-    # The option for booting from an HMC ISO image.
-    # For consistency, a list is used even though it is a single option.
-    boot_iso_option_names = (
-        'boot-iso',
-    )
-
-    # Options handled in this function
-    special_opt_names = \
-        boot_storage_option_names + old_boot_storage_option_names + \
-        boot_network_option_names + boot_ftp_option_names + \
-        boot_media_option_names + boot_iso_option_names
-    name_map = dict((opt, None) for opt in special_opt_names)
+    Parameters:
 
-    org_options = original_options(options)
-    properties = options_to_properties(org_options, name_map)
+      cmd_ctx (CmdContext): Context object of the command.
 
-    # Used and missing options handled in this function
+      org_options (dict): The options of the command, with their original
+        names.
+
+    Returns:
+
+      string: The group of boot options that is used, as one of 'storage',
+      'old-storage', 'network', 'ftp', 'media', 'iso', or `None` if no boot
+      options are used.
+    """
     used_boot_storage_opts = [
-        '--' + name for name in boot_storage_option_names
+        '--' + name for name in BOOT_STORAGE_OPTION_NAMES
         if org_options[name] is not None]
 
-    used_old_boot_storage_opts = [
-        '--' + name for name in old_boot_storage_option_names
-        if org_options[name] is not None]
-    missing_old_boot_storage_opts = [
-        '--' + name for name in old_boot_storage_option_names
-        if org_options[name] is None]
+    used_old_boot_storage_opts, missing_old_boot_storage_opts = \
+        used_and_missing_options(org_options, OLD_BOOT_STORAGE_OPTION_NAMES)
 
     used_boot_network_opts = [
-        '--' + name for name in boot_network_option_names
+        '--' + name for name in BOOT_NETWORK_OPTION_NAMES
         if org_options[name] is not None]
 
-    used_boot_ftp_opts = [
-        '--' + name for name in boot_ftp_option_names
-        if org_options[name] is not None]
-    missing_boot_ftp_opts = [
-        '--' + name for name in boot_ftp_option_names
-        if org_options[name] is None]
+    used_boot_ftp_opts, missing_boot_ftp_opts = used_and_missing_options(
+        org_options, BOOT_FTP_OPTION_NAMES)
 
     used_boot_media_opts = [
-        '--' + name for name in boot_media_option_names
+        '--' + name for name in BOOT_MEDIA_OPTION_NAMES
         if org_options[name] is not None]
 
     used_boot_iso_opts = [
-        '--' + name for name in boot_iso_option_names
+        '--' + name for name in BOOT_ISO_OPTION_NAMES
         if org_options[name] is not None]
 
     if used_boot_storage_opts and used_old_boot_storage_opts:
@@ -1148,6 +1393,70 @@ def cmd_partition_update(cmd_ctx, cpc_name, partition_name, options):
             cmd_ctx.error_format)
 
     if used_boot_storage_opts:
+        return 'storage'
+
+    if used_old_boot_storage_opts:
+        if missing_old_boot_storage_opts:
+            raise click_exception(
+                "Boot from storage volume specified using the deprecated "
+                "options --boot-storage-hba/lun/wwpn, but misses the "
+                "following options: {opts}".
+                format(opts=', '.join(missing_old_boot_storage_opts)),
+                cmd_ctx.error_format)
+        return 'old-storage'
+
+    if used_boot_network_opts:
+        return 'network'
+
+    if used_boot_ftp_opts:
+        if missing_boot_ftp_opts:
+            raise click_exception("Boot from FTP server specified, but misses "
+                                  "the following options: {o}".
+                                  format(o=', '.join(missing_boot_ftp_opts)),
+                                  cmd_ctx.error_format)
+        return 'ftp'
+
+    if used_boot_media_opts:
+        return 'media'
+
+    if used_boot_iso_opts:
+        return 'iso'
+
+    return None
+
+
+def partition_update_properties(cmd_ctx, partition, org_options, boot_opts):
+    """
+    Return the properties for updating a partition, from the options of the
+    'partition update' command.
+
+    The boot options must have been checked using check_update_boot_options().
+    They may need to look up storage volumes, HBAs or NICs of the partition on
+    the HMC. Errors are raised as click exceptions.
+
+    This function may run in worker threads when multiple partitions are
+    updated, so it does not display anything.
+
+    Parameters:
+
+      cmd_ctx (CmdContext): Context object of the command.
+
+      partition (zhmcclient.Partition): The partition to be updated.
+
+      org_options (dict): The options of the command, with their original
+        names.
+
+      boot_opts (string): The group of boot options that is used, as returned
+        by check_update_boot_options().
+
+    Returns:
+
+      dict: The properties for updating the partition.
+    """
+    properties = options_to_properties(
+        org_options, skip_names=UPDATE_SPECIAL_OPTION_NAMES)
+
+    if boot_opts == 'storage':
         sv_name = org_options['boot-storage-volume']
         if storage_management_feature(partition):
             storage_volume = parse_volume_with_sm(
@@ -1164,22 +1473,22 @@ def cmd_partition_update(cmd_ctx, cpc_name, partition_name, options):
             properties['boot-world-wide-port-name'] = wwpn
             properties['boot-logical-unit-number'] = lun
 
-    elif used_old_boot_storage_opts:
+    elif boot_opts == 'old-storage':
         if storage_management_feature(partition):
             raise click_exception(
                 "The deprecated options --boot-storage-hba/lun/wwpn can be "
                 "used only with CPCs without the storage management feature "
                 "(z13 and earlier)",
                 cmd_ctx.error_format)
-        if missing_old_boot_storage_opts:
-            raise click_exception(
-                "Boot from storage volume specified using the deprecated "
-                "options --boot-storage-hba/lun/wwpn, but misses the "
-                "following options: {opts}".
-                format(opts=', '.join(missing_old_boot_storage_opts)),
-                cmd_ctx.error_format)
-        click.echo("Deprecated: The options --boot-storage-hba/lun/wwpn are "
-                   "deprecated. Use the --boot-storage-volume option instead")
+        hba_name = org_options['boot-storage-hba']
+        try:
+            hba = partition.hbas.find(name=hba_name)
+        except zhmcclient.NotFound:
+            raise click_exception("Could not find HBA {h} in partition {p} in "
+                                  "CPC {c}.".
+                                  format(h=hba_name, p=partition.name,
+                                         c=partition.manager.parent.name),
+                                  cmd_ctx.error_format)
         properties['boot-device'] = 'storage-adapter'
         properties['boot-storage-device'] = hba.uri
         properties['boot-world-wide-port-name'] = \
@@ -1187,36 +1496,31 @@ def cmd_partition_update(cmd_ctx, cpc_name, partition_name, options):
         properties['boot-logical-unit-number'] = \
             org_options['boot-storage-lun']
 
-    elif used_boot_network_opts:
+    elif boot_opts == 'network':
         nic_name = org_options['boot-network-nic']
         try:
             nic = partition.nics.find(name=nic_name)
         except zhmcclient.NotFound:
             raise click_exception("Could not find NIC {n} in partition {p} in "
                                   "CPC {c}.".
-                                  format(n=nic_name, p=partition_name,
-                                         c=cpc_name),
+                                  format(n=nic_name, p=partition.name,
+                                         c=partition.manager.parent.name),
                                   cmd_ctx.error_format)
         properties['boot-device'] = 'network-adapter'
         properties['boot-network-device'] = nic.uri
 
-    elif used_boot_ftp_opts:
-        if missing_boot_ftp_opts:
-            raise click_exception("Boot from FTP server specified, but misses "
-                                  "the following options: {o}".
-                                  format(o=', '.join(missing_boot_ftp_opts)),
-                                  cmd_ctx.error_format)
+    elif boot_opts == 'ftp':
         properties['boot-device'] = 'ftp'
         properties['boot-ftp-host'] = org_options['boot-ftp-host']
         properties['boot-ftp-username'] = org_options['boot-ftp-username']
         properties['boot-ftp-password'] = org_options['boot-ftp-password']
         properties['boot-ftp-insfile'] = org_options['boot-ftp-insfile']
 
-    elif used_boot_media_opts:
+    elif boot_opts == 'media':
         properties['boot-device'] = 'removable-media'
         properties['boot-removable-media'] = org_options['boot-media-file']
 
-    elif used_boot_iso_opts:
+    elif boot_opts == 'iso':
         properties['boot-device'] = 'iso-image'
 
     else:
@@ -1227,35 +1531,99 @@ def cmd_partition_update(cmd_ctx, cpc_name, partition_name, options):
         properties['ssc-dns-servers'] = \
             org_options['ssc-dns-servers'].split(',')
 
+    return properties
+
+
+def update_partition(cmd_ctx, cpc_name, partition_name, org_options,
+                     boot_opts):
+    """
+    Update a partition from the options of the 'partition update' command,
+    and return the message to be displayed for the result.
+
+    The options are passed with their original names, and the group of boot
+    options that is used is passed as returned by check_update_boot_options().
+
+    Errors are raised as click exceptions.
+    """
+
+    client = cmd_ctx.client
+    partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
+
+    properties = partition_update_properties(
+        cmd_ctx, partition, org_options, boot_opts)
+
     if not properties:
-        cmd_ctx.spinner.stop()
-        click.echo("No properties specified for updating partition {p}.".
-                   format(p=partition_name))
-        return
+        return "No properties specified for updating partition {p}.". \
+            format(p=partition_name)
+
+    # Update only the properties whose value differs from the current value,
+    # so that repeated updates with the same options do not change the
+    # partition. Write-only properties (e.g. passwords) are not returned by
+    # the HMC and are therefore always updated. Only the specified properties
+    # are retrieved, unless the full properties have already been retrieved
+    # during the processing of the options.
+    if not partition.full_properties:
+        try:
+            pull_properties(partition, list(properties.keys()))
+        except zhmcclient.Error as exc:
+            raise click_exception(exc, cmd_ctx.error_format)
+    current_props = partition.properties
+    for name in list(properties.keys()):
+        if name in current_props and current_props[name] == properties[name]:
+            del properties[name]
+
+    if not properties:
+        return "Partition {p} already has the specified properties.". \
+            format(p=partition_name)
 
     try:
         partition.update_properties(properties)
     except zhmcclient.Error as exc:
         raise click_exception(exc, cmd_ctx.error_format)
+    uncache_partition(cmd_ctx, cpc_name, partition_name)
 
-    cmd_ctx.spinner.stop()
     if 'name' in properties and properties['name'] != partition_name:
-        click.echo("Partition {p} has been renamed to {pn} and was updated.".
-                   format(p=partition_name, pn=properties['name']))
-    else:
-        click.echo("Partition {p} has been updated.".format(p=partition_name))
+        return "Partition {p} has been renamed to {pn} and was updated.". \
+            format(p=partition_name, pn=properties['name'])
+    return "Partition {p} has been updated.".format(p=partition_name)
+
+
+def cmd_partition_update(cmd_ctx, cpc_name, partition_names, options):
+    # pylint: disable=missing-function-docstring
+
+    if len(set(partition_names)) > 1 and options['name'] is not None:
+        raise click_exception(
+            "The --name option cannot be used when updating multiple "
+            "partitions", cmd_ctx.error_format)
+
+    # The checks of the boot options and the deprecation warning do not
+    # depend on the partition, so they are done once here instead of in
+    # update_partition(), which may run concurrently for multiple partitions.
+    org_options = original_options(options)
+    boot_opts = check_update_boot_options(cmd_ctx, org_options)
+    if boot_opts == 'old-storage':
+        cmd_ctx.spinner.stop()
+        click.echo("Deprecated: The options --boot-storage-hba/lun/wwpn are "
+                   "deprecated. Use the --boot-storage-volume option instead")
+        cmd_ctx.spinner.start()
+
+    process_partitions(
+        cmd_ctx, partition_names,
+        lambda name: update_partition(
+            cmd_ctx, cpc_name, name, org_options, boot_opts))
 
 
 def cmd_partition_delete(cmd_ctx, cpc_name, partition_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
     try:
         partition.delete()
     except zhmcclient.Error as exc:
         raise click_exception(exc, cmd_ctx.error_format)
+    uncache_partition(cmd_ctx, cpc_name, partition_name)
 
     cmd_ctx.spinner.stop()
     click.echo("Partition {p} has been deleted.".format(p=partition_name))
@@ -1266,7 +1634,7 @@ def cmd_partition_console(cmd_ctx, cpc_name, partition_name, options):
 
     logger = logging.getLogger(CONSOLE_LOGGER_NAME)
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
     refresh = options['refresh']
@@ -1283,7 +1651,7 @@ def cmd_partition_console(cmd_ctx, cpc_name, partition_name, options):
 def cmd_partition_dump(cmd_ctx, cpc_name, partition_name, **options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
     options = original_options(options)
 
@@ -1367,15 +1735,21 @@ def partition_dump_without_sm(cmd_ctx, partition, **options):
 def cmd_partition_mount_iso(cmd_ctx, cpc_name, partition_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
     image_file = options['imagefile']
     _, image_name = os.path.split(image_file)
-    with open(image_file, 'rb') as image_fp:
-        partition.mount_iso_image(image_fp, image_name, options['imageinsfile'])
-    if options['boot']:
-        partition.update_properties({'boot-device': 'iso-image'})
+    # The image file is read with a large buffer, because it is sent to the
+    # HMC in many small blocks.
+    try:
+        with open(image_file, 'rb', ISO_IMAGE_BUFFER_SIZE) as image_fp:
+            partition.mount_iso_image(
+                image_fp, image_name, options['imageinsfile'])
+        if options['boot']:
+            partition.update_properties({'boot-device': 'iso-image'})
+    except zhmcclient.Error as exc:
+        raise click_exception(exc, cmd_ctx.error_format)
     cmd_ctx.spinner.stop()
     click.echo("ISO image {i} has been mounted to Partition {p}.".
                format(i=image_name, p=partition.name))
@@ -1384,16 +1758,21 @@ def cmd_partition_mount_iso(cmd_ctx, cpc_name, partition_name, options):
 def cmd_partition_unmount_iso(cmd_ctx, cpc_name, partition_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
-    partition.pull_full_properties()
-    image_name = partition.get_property('boot-iso-image-name')
+    try:
+        pull_properties(partition, ['boot-iso-image-name', 'boot-device'])
+        image_name = partition.get_property('boot-iso-image-name')
+        if image_name:
+            boot_device = partition.get_property('boot-device')
+            if boot_device == 'iso-image':
+                partition.update_properties({'boot-device': 'none'})
+            partition.unmount_iso_image()
+    except zhmcclient.Error as exc:
+        raise click_exception(exc, cmd_ctx.error_format)
+
     if image_name:
-        boot_device = partition.get_property('boot-device')
-        if boot_device == 'iso-image':
-            partition.update_properties({'boot-device': 'none'})
-        partition.unmount_iso_image()
         cmd_ctx.spinner.stop()
         click.echo("ISO image {i} has been unmounted from Partition {p}.".
                    format(i=image_name, p=partition.name))
@@ -1406,7 +1785,7 @@ def cmd_partition_unmount_iso(cmd_ctx, cpc_name, partition_name):
 def cmd_partition_list_storagegroups(cmd_ctx, cpc_name, partition_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
     try:
@@ -1428,7 +1807,7 @@ def cmd_partition_attach_storagegroup(
         cmd_ctx, cpc_name, partition_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
     stogrp_name = options['storagegroup']
@@ -1448,7 +1827,7 @@ def cmd_partition_detach_storagegroup(
         cmd_ctx, cpc_name, partition_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
     stogrp_name = options['storagegroup']
@@ -113,7 +113,7 @@ def port_update(cmd_ctx, cpc, adapter, port, **options):
 def cmd_port_list(cmd_ctx, cpc_name, adapter_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     adapter = find_adapter(cmd_ctx, client, cpc_name, adapter_name)
 
     try:
@@ -152,7 +152,7 @@ def cmd_port_list(cmd_ctx, cpc_name, adapter_name, options):
 def cmd_port_show(cmd_ctx, cpc_name, adapter_name, port_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     port = find_port(cmd_ctx, client, cpc_name, adapter_name, port_name)
 
     try:
@@ -166,7 +166,7 @@ def cmd_port_show(cmd_ctx, cpc_name, adapter_name, port_name):
 def cmd_port_update(cmd_ctx, cpc_name, adapter_name, port_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     port = find_port(cmd_ctx, client, cpc_name, adapter_name, port_name)
 
     org_options = original_options(options)
@@ -349,7 +349,7 @@ def storagegroup_discover_fcp(cmd_ctx, storagegroup, **options):
 def cmd_storagegroup_list(cmd_ctx, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     console = client.consoles.console
 
     try:
@@ -392,7 +392,7 @@ def cmd_storagegroup_list(cmd_ctx, options):
 def cmd_storagegroup_show(cmd_ctx, stogrp_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     stogrp = find_storagegroup(cmd_ctx, client, stogrp_name)
 
     try:
@@ -406,7 +406,7 @@ def cmd_storagegroup_show(cmd_ctx, stogrp_name):
 def cmd_storagegroup_create(cmd_ctx, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     console = client.consoles.console
 
     name_map = {
@@ -443,7 +443,7 @@ def cmd_storagegroup_create(cmd_ctx, options):
 def cmd_storagegroup_update(cmd_ctx, stogrp_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     stogrp = find_storagegroup(cmd_ctx, client, stogrp_name)
 
     name_map = {
@@ -486,7 +486,7 @@ def cmd_storagegroup_update(cmd_ctx, stogrp_name, options):
 def cmd_storagegroup_delete(cmd_ctx, stogrp_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     stogrp = find_storagegroup(cmd_ctx, client, stogrp_name)
 
     options = original_options(options)
@@ -509,7 +509,7 @@ def cmd_storagegroup_delete(cmd_ctx, stogrp_name, options):
 def cmd_storagegroup_list_partitions(cmd_ctx, stogrp_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     stogrp = find_storagegroup(cmd_ctx, client, stogrp_name)
 
     filter_name = options['name']
@@ -542,7 +542,7 @@ def cmd_storagegroup_list_partitions(cmd_ctx, stogrp_name, options):
 def cmd_storagegroup_list_ports(cmd_ctx, stogrp_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     stogrp = find_storagegroup(cmd_ctx, client, stogrp_name)
 
     try:
@@ -575,7 +575,7 @@ def cmd_storagegroup_list_ports(cmd_ctx, stogrp_name):
 def cmd_storagegroup_add_ports(cmd_ctx, stogrp_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     stogrp = find_storagegroup(cmd_ctx, client, stogrp_name)
     cpc = stogrp.cpc
 
@@ -612,7 +612,7 @@ def cmd_storagegroup_add_ports(cmd_ctx, stogrp_name, options):
 def cmd_storagegroup_remove_ports(cmd_ctx, stogrp_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     stogrp = find_storagegroup(cmd_ctx, client, stogrp_name)
     cpc = stogrp.cpc
 
@@ -649,7 +649,7 @@ def cmd_storagegroup_remove_ports(cmd_ctx, stogrp_name, options):
 def cmd_storagegroup_discover_fcp(cmd_ctx, stogrp_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     stogrp = find_storagegroup(cmd_ctx, client, stogrp_name)
 
     force_restart = options['force_restart']
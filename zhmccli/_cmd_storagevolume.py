@@ -273,7 +273,7 @@ def storagevolume_fulfill_fcp(cmd_ctx, storagegroup, storagevolume, **options):
 def cmd_storagevolume_list(cmd_ctx, stogrp_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     stogrp = find_storagegroup(cmd_ctx, client, stogrp_name)
 
     try:
@@ -311,7 +311,7 @@ def cmd_storagevolume_list(cmd_ctx, stogrp_name, options):
 def cmd_storagevolume_show(cmd_ctx, stogrp_name, stovol_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     stovol = find_storagevolume(cmd_ctx, client, stogrp_name, stovol_name)
 
     try:
@@ -325,7 +325,7 @@ def cmd_storagevolume_show(cmd_ctx, stogrp_name, stovol_name):
 def cmd_storagevolume_create(cmd_ctx, stogrp_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     stogrp = find_storagegroup(cmd_ctx, client, stogrp_name)
 
     name_map = {
@@ -357,7 +357,7 @@ def cmd_storagevolume_create(cmd_ctx, stogrp_name, options):
 def cmd_storagevolume_update(cmd_ctx, stogrp_name, stovol_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     stovol = find_storagevolume(cmd_ctx, client, stogrp_name, stovol_name)
 
     name_map = {
@@ -400,7 +400,7 @@ def cmd_storagevolume_update(cmd_ctx, stogrp_name, stovol_name, options):
 def cmd_storagevolume_delete(cmd_ctx, stogrp_name, stovol_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     stovol = find_storagevolume(cmd_ctx, client, stogrp_name, stovol_name)
 
     email_insert = options['email-insert']
@@ -421,7 +421,7 @@ def cmd_storagevolume_delete(cmd_ctx, stogrp_name, stovol_name, options):
 def cmd_storagevolume_fulfill_fcp(cmd_ctx, stogrp_name, stovol_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     stovol = find_storagevolume(cmd_ctx, client, stogrp_name, stovol_name)
     cpc = stovol.manager.parent.cpc
 
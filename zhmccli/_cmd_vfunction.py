@@ -176,7 +176,7 @@ def vfunction_delete(cmd_ctx, cpc, partition, vfunction):
 def cmd_vfunction_list(cmd_ctx, cpc_name, partition_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
     try:
@@ -215,7 +215,7 @@ def cmd_vfunction_list(cmd_ctx, cpc_name, partition_name, options):
 def cmd_vfunction_show(cmd_ctx, cpc_name, partition_name, vfunction_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     vfunction = find_vfunction(cmd_ctx, client, cpc_name, partition_name,
                                vfunction_name)
 
@@ -230,7 +230,7 @@ def cmd_vfunction_show(cmd_ctx, cpc_name, partition_name, vfunction_name):
 def cmd_vfunction_create(cmd_ctx, cpc_name, partition_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     partition = find_partition(cmd_ctx, client, cpc_name, partition_name)
 
     name_map = {
@@ -263,7 +263,7 @@ def cmd_vfunction_update(cmd_ctx, cpc_name, partition_name, vfunction_name,
                          options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     vfunction = find_vfunction(cmd_ctx, client, cpc_name, partition_name,
                                vfunction_name)
 
@@ -308,7 +308,7 @@ def cmd_vfunction_update(cmd_ctx, cpc_name, partition_name, vfunction_name,
 def cmd_vfunction_delete(cmd_ctx, cpc_name, partition_name, vfunction_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     vfunction = find_vfunction(cmd_ctx, client, cpc_name, partition_name,
                                vfunction_name)
 
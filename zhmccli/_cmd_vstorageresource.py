@@ -137,7 +137,7 @@ def vstorageresource_update(cmd_ctx, storagegroup, vstorageresource, **options):
 def cmd_vstorageresource_list(cmd_ctx, stogrp_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     stogrp = find_storagegroup(cmd_ctx, client, stogrp_name)
     cpc = stogrp.cpc
 
@@ -205,7 +205,7 @@ def cmd_vstorageresource_list(cmd_ctx, stogrp_name, options):
 def cmd_vstorageresource_show(cmd_ctx, stogrp_name, vsr_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     vsr = find_vstorageresource(cmd_ctx, client, stogrp_name, vsr_name)
 
     try:
@@ -219,7 +219,7 @@ def cmd_vstorageresource_show(cmd_ctx, stogrp_name, vsr_name):
 def cmd_vstorageresource_update(cmd_ctx, stogrp_name, vsr_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     vsr = find_vstorageresource(cmd_ctx, client, stogrp_name, vsr_name)
     cpc = vsr.manager.parent.cpc
 
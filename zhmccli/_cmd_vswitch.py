@@ -118,7 +118,7 @@ def vswitch_update(cmd_ctx, cpc, vswitch, **options):
 def cmd_vswitch_list(cmd_ctx, cpc_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     cpc = find_cpc(cmd_ctx, client, cpc_name)
 
     try:
@@ -167,7 +167,7 @@ def cmd_vswitch_list(cmd_ctx, cpc_name, options):
 def cmd_vswitch_show(cmd_ctx, cpc_name, vswitch_name):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     vswitch = find_vswitch(cmd_ctx, client, cpc_name, vswitch_name)
 
     try:
@@ -181,7 +181,7 @@ def cmd_vswitch_show(cmd_ctx, cpc_name, vswitch_name):
 def cmd_vswitch_update(cmd_ctx, cpc_name, vswitch_name, options):
     # pylint: disable=missing-function-docstring
 
-    client = zhmcclient.Client(cmd_ctx.session)
+    client = cmd_ctx.client
     vswitch = find_vswitch(cmd_ctx, client, cpc_name, vswitch_name)
 
     org_options = original_options(options)
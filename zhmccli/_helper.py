@@ -29,7 +29,6 @@ import click_spinner
 from tabulate import tabulate
 
 import zhmcclient
-import zhmcclient_mock
 
 # Importing readline makes interactive mode keep history
 # pylint: disable=import-error,unused-import
@@ -60,6 +59,22 @@ LOG_LEVELS = ['error', 'warning', 'info', 'debug']
 
 LOG_COMPONENTS = ['api', 'hmc', 'console', 'all']
 
+# Maximum number of HMC operations that are performed concurrently, for
+# commands that perform the same operation on multiple resources.
+# The zhmcclient session keeps its HTTP connections to the HMC alive in a
+# connection pool of the 'requests' package, with the default pool size of
+# that package (requests.adapters.DEFAULT_POOLSIZE, which is 10). More
+# concurrent operations than that would not reuse the kept-alive connections,
+# but open and discard additional connections (with a new SSL/TLS handshake
+# each). The value is not imported from the 'requests' package, because that
+# package is used only indirectly through zhmcclient.
+MAX_CONCURRENT_OPERATIONS = 10
+
+# Maximum number of resource objects in the resource cache of a command
+# context. When it is exceeded, the least recently used resource objects
+# are removed from the cache.
+RESOURCE_CACHE_SIZE = 256
+
 SYSLOG_FACILITIES = ['user', 'local0', 'local1', 'local2', 'local3', 'local4',
                      'local5', 'local6', 'local7']
 
@@ -168,6 +183,81 @@ class InvalidOutputFormatError(click.ClickException):
         super(InvalidOutputFormatError, self).__init__(msg)
 
 
+class ResourceCache(object):
+    """
+    A cache of resource objects with a maximum size, that removes the least
+    recently used resource objects when the maximum size is exceeded.
+
+    The interface is a subset of the interface of a dict. The cache can be
+    used from multiple threads (e.g. by commands that process multiple
+    resources concurrently).
+    """
+
+    def __init__(self, maxsize=RESOURCE_CACHE_SIZE):
+        self._maxsize = maxsize
+        self._items = OrderedDict()  # in order of least recent use first
+        self._lock = threading.RLock()
+        self._key_locks = {}  # by key
+
+    def key_lock(self, key):
+        """
+        Return a lock for the key, that can be acquired by callers to perform
+        a lookup of a resource and its addition to the cache, as one step.
+
+        This ensures that threads that need the same resource at the same
+        time look it up on the HMC only once, while lookups of other resources
+        and accesses to the cache are not blocked. The lock for a key remains
+        the same for the lifetime of the cache, even if the key is removed
+        from the cache.
+
+        Returns:
+          :class:`py:threading.Lock`: The lock for the key.
+        """
+        with self._lock:
+            try:
+                return self._key_locks[key]
+            except KeyError:
+                key_lock = threading.Lock()
+                self._key_locks[key] = key_lock
+                return key_lock
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._items.pop(key, None)
+            self._items[key] = value
+            while len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+
+    def get(self, key, default=None):
+        """
+        Return the cached value for the key and mark it as most recently used,
+        or return the default if the key is not in the cache.
+        """
+        with self._lock:
+            try:
+                value = self._items.pop(key)
+            except KeyError:
+                return default
+            self._items[key] = value
+            return value
+
+    def pop(self, key, default=None):
+        """
+        Remove the key from the cache and return its value, or return the
+        default if the key is not in the cache.
+        """
+        with self._lock:
+            return self._items.pop(key, default)
+
+
 class CmdContext(object):
     """
     A context object we attach to the :class:`click.Context` object in its
@@ -190,7 +280,9 @@ class CmdContext(object):
         self._session_id = session_id
         self._get_password = get_password
         self._session = None
+        self._client = None
         self._spinner = click_spinner.Spinner()
+        self._resource_cache = ResourceCache()
 
     def __repr__(self):
         ret = "CmdContext(at 0x{ctx:08x}, host={s._host!r}, " \
@@ -287,6 +379,22 @@ class CmdContext(object):
         """
         return self._session
 
+    @property
+    def client(self):
+        """
+        :class:`zhmcclient.Client`: Client for the session of this command
+        context.
+
+        The client is created on first use and is then reused for the
+        lifetime of this command context, so that the commands use a single
+        client object for all their HMC operations. It must not be used before
+        the session has been created (i.e. before the command is executed).
+        """
+        if self._client is None:
+            assert self._session is not None
+            self._client = zhmcclient.Client(self._session)
+        return self._client
+
     @property
     def spinner(self):
         """
@@ -298,12 +406,32 @@ class CmdContext(object):
         """
         return self._spinner
 
+    @property
+    def resource_cache(self):
+        """
+        :class:`ResourceCache`: Cache of resource objects that have been
+        looked up by name during the lifetime of this command context, so that
+        repeated lookups of the same resource do not cause repeated HMC
+        operations. It holds at most :data:`RESOURCE_CACHE_SIZE` resource
+        objects.
+
+        The cache key is a tuple whose first item is the resource type (e.g.
+        'cpc' or 'partition') and whose remaining items are the names of the
+        resource and its parent resources. The cached value is the resource
+        object.
+        """
+        return self._resource_cache
+
     def execute_cmd(self, cmd):
         """
         Execute the command.
         """
         if self._session is None:
-            if isinstance(self._session_id, zhmcclient_mock.FakedSession):
+            if self._session_id is not None and \
+                    not isinstance(self._session_id, six.string_types):
+                # A faked session (zhmcclient_mock.FakedSession). The
+                # zhmcclient_mock package is not imported for the
+                # isinstance() check, because it takes a while to import.
                 self._session = self._session_id
             else:
                 if self._host is None:
@@ -361,7 +489,7 @@ def original_options(options):
     return org_options
 
 
-def options_to_properties(options, name_map=None):
+def options_to_properties(options, name_map=None, skip_names=None):
     """
     Convert click options into HMC resource properties.
 
@@ -375,6 +503,11 @@ def options_to_properties(options, name_map=None):
     using that dictionary. If an option name is mapped to `None`, it is not
     going to be added to the set of returned resource properties.
 
+    If a set of option names to be skipped is specified, these options are
+    not going to be added to the set of returned resource properties. This
+    is simpler than mapping them to `None` in a name mapping dictionary,
+    for options that are handled by the caller.
+
     Parameters:
 
       options (dict): The options dictionary (key: original option name,
@@ -384,6 +517,9 @@ def options_to_properties(options, name_map=None):
         option name, value: property name, or `None` to not add this option to
         the returned properties).
 
+      skip_names (frozenset of string): `None` or set of original option
+        names that are not added to the returned properties.
+
     Returns:
 
       dict: Resource properties (key: property name, value: option value)
@@ -392,6 +528,8 @@ def options_to_properties(options, name_map=None):
     for name, value in six.iteritems(options):
         if value is None:
             continue
+        if skip_names and name in skip_names:
+            continue
         if name_map:
             name = name_map.get(name, name)
         if name is not None:
@@ -507,6 +645,23 @@ def print_properties_as_table(
     click.echo(out_str)
 
 
+def show_list_columns(show_list, additions):
+    """
+    Return the columns to be shown for a list of resources, as a list of
+    tuples (name, column_additions), where column_additions is the dict of
+    additional property values keyed by resource URI for that property, or
+    `None` if the property value is to be taken from the resource object.
+
+    This is determined once for all resources, so that the per-resource
+    loops do not need to look up the additions for each property.
+    """
+    if not show_list:
+        return []
+    if not additions:
+        return [(name, None) for name in show_list]
+    return [(name, additions.get(name, None)) for name in show_list]
+
+
 def print_resources_as_table(
         cmd_ctx, resources, table_format, show_list=None, additions=None,
         all=False):
@@ -556,12 +711,14 @@ def print_resources_as_table(
     prop_names = OrderedDict()  # key: property name, value: None
     remaining_prop_names = OrderedDict()  # key: property name, value: None
     resource_props_list = []
+    columns = show_list_columns(show_list, additions)
     for resource in resources:
         resource_props = dict()
         if show_list:
-            for name in show_list:
-                if additions and name in additions:
-                    value = additions[name][resource.uri]
+            uri = resource.uri
+            for name, column_additions in columns:
+                if column_additions is not None:
+                    value = column_additions[uri]
                 else:
                     value = resource.prop(name)
                 resource_props[name] = value
@@ -736,12 +893,14 @@ def print_resources_as_json(
     """
     prop_names = OrderedDict()  # key: property name, value: None
     resource_props_list = []
+    columns = show_list_columns(show_list, additions)
     for resource in resources:
         resource_props = dict()
         if show_list:
-            for name in show_list:
-                if additions and name in additions:
-                    value = additions[name][resource.uri]
+            uri = resource.uri
+            for name, column_additions in columns:
+                if column_additions is not None:
+                    value = column_additions[uri]
                 else:
                     value = resource.prop(name)
                 resource_props[name] = value
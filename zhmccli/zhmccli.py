@@ -30,7 +30,6 @@ import click_repl
 from prompt_toolkit.history import FileHistory
 
 import zhmcclient
-import zhmcclient_mock
 from ._helper import CmdContext, GENERAL_OPTIONS_METAVAR, REPL_HISTORY_FILE, \
     REPL_PROMPT, TABLE_FORMATS, LOG_LEVELS, LOG_DESTINATIONS, \
     SYSLOG_FACILITIES, click_exception
@@ -284,6 +283,11 @@ def cli(ctx, host, userid, password, no_verify, ca_certs, output_format,
         # A SyntaxError raised by an incorrect expression is considered
         # an internal error in the function tests and is therefore not
         # handled.
+        # The zhmcclient_mock package is imported only here, because it is
+        # needed only for the function tests and takes a while to import.
+        # The expression usually refers to it.
+        # pylint: disable=import-outside-toplevel
+        import zhmcclient_mock
         expr = session_id.split(':', 1)[1]
         faked_session = eval(expr)  # pylint: disable=eval-used
         assert isinstance(faked_session, zhmcclient_mock.FakedSession)
@@ -326,12 +330,16 @@ def cli(ctx, host, userid, password, no_verify, ca_certs, output_format,
 def reset_logger(log_comp):
     """
     Reset the logger for the specified log component to have exactly one
-    NullHandler.
+    NullHandler and its default log level.
     """
 
     name = LOGGER_NAMES[log_comp]
     logger = logging.getLogger(name)
 
+    # The default log level of the root logger is WARNING, and other loggers
+    # have no log level of their own by default.
+    logger.setLevel(logging.NOTSET if name else logging.WARNING)
+
     has_nh = False
     for h in logger.handlers:
         if not has_nh and isinstance(h, NullHandler):